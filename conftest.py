@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures
+
+Deterministic OHLCV frames used by the division-by-zero tests. Each frame is
+built once per session and cached as Parquet in the system temp directory,
+so later runs load it instead of regenerating it. The all-gains, all-losses
+and flat regimes live in one master frame that their fixtures slice. Fixtures
+are shared, so tests must treat the frames as read-only.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Bump when a builder below changes so stale cached frames are not reused
+FIXTURE_VERSION = 4
+FIXTURE_CACHE_DIR = Path(tempfile.gettempdir())
+
+
+def _cached_frame(name: str, build) -> pd.DataFrame:
+    """Load fixture frame name from the Parquet cache, building and caching it on a miss"""
+    path = FIXTURE_CACHE_DIR / f'trading_fixture_{name}_v{FIXTURE_VERSION}.parquet'
+    if path.exists():
+        return pd.read_parquet(path)
+    df = build()
+    # Write under a per-process name and rename into place, so parallel
+    # (pytest -n) workers never read a half-written file
+    tmp_path = path.with_name(f'{path.stem}.{os.getpid()}.tmp')
+    try:
+        df.to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Cache is best effort; the built frame is still usable
+    return df
+
+
+def _hourly(periods: int) -> pd.DatetimeIndex:
+    return pd.date_range('2024-01-01', periods=periods, freq='1h')
+
+
+_OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def _ohlcv_frame(open_, high, low, close, volume) -> pd.DataFrame:
+    """
+    Hourly OHLCV frame whose price and volume columns share one float64 block
+
+    The columns are written into a single preallocated (n, 5) buffer that the
+    DataFrame wraps without copying; timestamp is added as its own column.
+    """
+    n = len(open_)
+    data = np.empty((n, len(_OHLCV_COLUMNS)), dtype=np.float64)
+    data[:, 0] = open_
+    data[:, 1] = high
+    data[:, 2] = low
+    data[:, 3] = close
+    data[:, 4] = volume
+    df = pd.DataFrame(data, columns=_OHLCV_COLUMNS, copy=False)
+    df.insert(0, 'timestamp', _hourly(n))
+    return df
+
+
+def _build_all_gains() -> pd.DataFrame:
+    """50 candles with only upward movements (RSI loss = 0)"""
+    prices = 100 + np.arange(50) * 0.5  # Constant upward trend
+    return _ohlcv_frame(
+        open_=prices,
+        high=prices + 0.5,
+        low=prices - 0.3,
+        close=prices + 0.4,
+        volume=1000
+    )
+
+
+def _build_all_losses() -> pd.DataFrame:
+    """50 candles with only downward movements (RSI gain = 0)"""
+    prices = 100 - np.arange(50) * 0.5  # Constant downward trend
+    return _ohlcv_frame(
+        open_=prices,
+        high=prices + 0.3,
+        low=prices - 0.5,
+        close=prices - 0.4,
+        volume=1000
+    )
+
+
+def _build_flat() -> pd.DataFrame:
+    """50 perfectly flat candles (high == low)"""
+    flat = np.full(50, 100.0)
+    return _ohlcv_frame(
+        open_=flat,
+        high=flat,
+        low=flat,
+        close=flat,
+        volume=1000
+    )
+
+
+def _build_regimes() -> pd.DataFrame:
+    """The three deterministic regimes stacked into one frame, keyed by name"""
+    return pd.concat(
+        [_build_all_gains(), _build_all_losses(), _build_flat()],
+        keys=['all_gains', 'all_losses', 'flat']
+    )
+
+
+def _build_tiny_price() -> pd.DataFrame:
+    """100 candles around 0.001 to stress price-ratio comparisons"""
+    rng = np.random.default_rng(42)
+    prices = 0.001 + np.abs(rng.standard_normal(100) * 0.0001)  # Very small prices
+    return _ohlcv_frame(
+        open_=prices,
+        high=prices * 1.01,
+        low=prices * 0.99,
+        close=prices * 1.005,
+        volume=1000
+    )
+
+
+def _build_random_walk() -> pd.DataFrame:
+    """50 candles of a seeded random walk with mixed up/down movements"""
+    rng = np.random.default_rng(42)
+    prices = np.r_[100.0, 100.0 + np.cumsum(rng.standard_normal(49) * 2)]  # Random walk
+    return _ohlcv_frame(
+        open_=prices,
+        high=prices + np.abs(rng.standard_normal(50)),
+        low=prices - np.abs(rng.standard_normal(50)),
+        close=prices + rng.standard_normal(50) * 0.5,
+        volume=1000 + rng.integers(-100, 100, size=50)
+    )
+
+
+def _build_pattern() -> pd.DataFrame:
+    """100 candles containing a manual double top followed by noise"""
+    rng = np.random.default_rng(42)
+    base = 100
+    # Up to first peak
+    up1 = base + np.arange(20) * 0.5
+    # Down from first peak
+    down1 = up1[-1] - np.arange(10) * 0.4
+    # Up to second peak (similar to first)
+    up2 = down1[-1] + np.arange(20) * 0.5
+    # Down from second peak
+    down2 = up2[-1] - np.arange(20) * 0.3
+    # Fill remaining
+    fill = down2[-1] + rng.standard_normal(100 - 70) * 0.5
+    prices = np.concatenate([up1, down1, up2, down2, fill])
+    return _ohlcv_frame(
+        open_=prices,
+        high=prices + np.abs(rng.standard_normal(100) * 0.3),
+        low=prices - np.abs(rng.standard_normal(100) * 0.3),
+        close=prices + rng.standard_normal(100) * 0.2,
+        volume=1000 + rng.integers(-100, 100, size=100)
+    )
+
+
+@pytest.fixture(scope='session')
+def regimes_df() -> pd.DataFrame:
+    return _cached_frame('regimes', _build_regimes)
+
+
+@pytest.fixture(scope='session')
+def all_gains_df(regimes_df) -> pd.DataFrame:
+    return regimes_df.loc['all_gains']
+
+
+@pytest.fixture(scope='session')
+def all_losses_df(regimes_df) -> pd.DataFrame:
+    return regimes_df.loc['all_losses']
+
+
+@pytest.fixture(scope='session')
+def flat_df(regimes_df) -> pd.DataFrame:
+    return regimes_df.loc['flat']
+
+
+@pytest.fixture(scope='session')
+def tiny_price_df() -> pd.DataFrame:
+    return _cached_frame('tiny_price', _build_tiny_price)
+
+
+@pytest.fixture(scope='session')
+def random_walk_df() -> pd.DataFrame:
+    return _cached_frame('random_walk', _build_random_walk)
+
+
+@pytest.fixture(scope='session')
+def pattern_df() -> pd.DataFrame:
+    return _cached_frame('pattern', _build_pattern)
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Optional Numba JIT support
+
+Numeric kernels are decorated with ``njit`` from this module. When numba is
+installed they are compiled to machine code on first call (and cached on
+disk); without it ``njit`` is a no-op and the kernels run as plain Python,
+so numba stays an optional dependency. precompile_kernels.py fills the disk
+cache ahead of time.
+
+Usage:
+    from _njit import njit, prange
+
+    @njit(cache=True)
+    def kernel(values):
+        ...
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, usable with or without arguments"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ['njit', 'prange', 'NUMBA_AVAILABLE']
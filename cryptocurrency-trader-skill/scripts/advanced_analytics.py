@@ -12,6 +12,35 @@ from typing import Dict, List, Tuple, Optional
 import warnings
 warnings.filterwarnings('ignore')
 
+from _njit import njit, prange, NUMBA_AVAILABLE
+
+
+@njit(parallel=True, cache=True)
+def _gbm_terminal(current_price: float, growth: np.ndarray) -> np.ndarray:
+    """
+    Terminal price of each simulated path from its per-day growth factors
+
+    Simulations are independent, so they run in parallel under numba. A step
+    that is not finite and positive leaves the price unchanged.
+
+    Args:
+        current_price: Starting price of every path
+        growth: (num_simulations, steps) array of exp(clipped log return)
+
+    Returns:
+        Final price per simulation
+    """
+    num_simulations, steps = growth.shape
+    final_prices = np.empty(num_simulations)
+    for sim in prange(num_simulations):
+        price = current_price
+        for day in range(steps):
+            new_value = price * growth[sim, day]
+            if np.isfinite(new_value) and new_value > 0:
+                price = new_value
+        final_prices[sim] = price
+    return final_prices
+
 
 class AdvancedAnalytics:
     """
@@ -34,11 +63,15 @@ class AdvancedAnalytics:
         current_price: float,
         returns: pd.Series,
         days_ahead: int = 5,
-        num_simulations: int = 10000
+        num_simulations: int = 10000,
+        rng: Optional[np.random.Generator] = None
     ) -> Dict:
         """
         Monte Carlo simulation for price prediction with confidence intervals
         Uses geometric Brownian motion with actual return distribution
+
+        Shocks are drawn from rng when given, otherwise from the global
+        np.random state.
         """
         if len(returns) < 30:
             return {'error': 'Insufficient data for Monte Carlo simulation (need 30+ periods)'}
@@ -51,40 +84,31 @@ class AdvancedAnalytics:
         if std_return == 0 or np.isnan(mean_return) or np.isnan(std_return):
             return {'error': 'Invalid return statistics for simulation'}
 
-        # Run simulations with overflow protection
-        simulations = np.zeros((num_simulations, days_ahead))
-        simulations[:, 0] = current_price
-
         # Cap extreme moves to prevent overflow
         max_exponent = 5.0  # exp(5) ≈ 148x, exp(-5) ≈ 0.0067x
 
-        for sim in range(num_simulations):
-            for day in range(1, days_ahead):
-                # Geometric Brownian Motion with Itô's Lemma correction
-                # The drift term must be adjusted by -0.5*σ² to avoid systematic bias
-                # This ensures E[S(t+1)] = S(t) * exp(μ) rather than being biased upward
-                drift = mean_return - 0.5 * std_return**2
-                shock = std_return * np.random.randn()
-
-                # Clamp exponent to prevent overflow
-                exponent = np.clip(drift + shock, -max_exponent, max_exponent)
-
-                try:
-                    new_value = simulations[sim, day-1] * np.exp(exponent)
-
-                    # Validate result is finite
-                    if np.isfinite(new_value) and new_value > 0:
-                        simulations[sim, day] = new_value
-                    else:
-                        # If invalid, use previous value (no change)
-                        simulations[sim, day] = simulations[sim, day-1]
-
-                except (OverflowError, FloatingPointError):
-                    # Fallback to previous value on overflow
-                    simulations[sim, day] = simulations[sim, day-1]
-
-        # Calculate statistics with validation
-        final_prices = simulations[:, -1]
+        # Geometric Brownian Motion with Itô's Lemma correction
+        # The drift term must be adjusted by -0.5*σ² to avoid systematic bias
+        # This ensures E[S(t+1)] = S(t) * exp(μ) rather than being biased upward
+        drift = mean_return - 0.5 * std_return**2
+        # Draw every shock at once; row-major order matches one draw per (sim, day)
+        standard_normal = rng.standard_normal if rng is not None else np.random.standard_normal
+        shocks = std_return * standard_normal((num_simulations, days_ahead - 1))
+        # Clamp exponent to prevent overflow
+        growth = np.exp(np.clip(drift + shocks, -max_exponent, max_exponent))
+
+        if NUMBA_AVAILABLE:
+            final_prices = _gbm_terminal(float(current_price), growth)
+        else:
+            # Same steps as _gbm_terminal, one whole column of simulations at a time
+            final_prices = np.full(num_simulations, float(current_price))
+            with np.errstate(over='ignore', invalid='ignore'):
+                for day in range(days_ahead - 1):
+                    new_value = final_prices * growth[:, day]
+                    # Keep the previous value (no change) wherever the step is not finite and positive
+                    final_prices = np.where(
+                        np.isfinite(new_value) & (new_value > 0), new_value, final_prices
+                    )
 
         # Filter out any invalid values
         valid_prices = final_prices[np.isfinite(final_prices) & (final_prices > 0)]
@@ -10,8 +10,35 @@ from scipy import stats
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 import warnings
+
+from indicator_kernels import rsi_np
+
 warnings.filterwarnings('ignore')
 
+# Benford's Law probability of each first digit 1-9: log10(1 + 1/d)
+BENFORD_PROBS = np.log10(1 + 1 / np.arange(1, 10))
+
+
+def _first_significant_digits(values) -> np.ndarray:
+    """
+    Extract the first significant digit (1-9) of every value
+
+    Returns:
+        int8 array with -1 where no digit exists (zero, NaN, inf)
+    """
+    a = np.abs(np.asarray(values, dtype=np.float64))
+    valid = np.isfinite(a) & (a > 0)
+    # Lift subnormals into the normal range; 10 ** exponent would underflow to 0
+    a = np.where(a < 1e-290, a * 1e30, a)
+    exponent = np.floor(np.log10(a, out=np.zeros_like(a), where=valid))
+    mantissa = np.divide(a, np.power(10.0, exponent), out=np.zeros_like(a), where=valid)
+    # Nudge mantissas that log10 rounding pushed just outside [1, 10)
+    mantissa = np.where(mantissa >= 10, mantissa / 10, mantissa)
+    mantissa = np.where(valid & (mantissa < 1), mantissa * 10, mantissa)
+    digits = np.floor(mantissa).astype(np.int8)
+    digits[~valid] = -1
+    return digits
+
 
 class AdvancedValidator:
     """
@@ -198,30 +225,17 @@ class AdvancedValidator:
 
         # Method 4: Benford's Law check (detects fabricated data)
         # Extract first significant digit (1-9) from volume data
-        def extract_first_digit(value):
-            """Extract first significant digit for Benford's Law test"""
-            if pd.isna(value) or value == 0:
-                return None
-            # Convert to absolute value and string, remove decimal point
-            abs_str = str(abs(value)).replace('.', '').replace('e', '').replace('+', '').replace('-', '')
-            # Strip leading zeros
-            stripped = abs_str.lstrip('0')
-            if stripped and stripped[0].isdigit():
-                return int(stripped[0])
-            return None
-
-        first_digits = df['volume'].apply(extract_first_digit).dropna()
+        digits = _first_significant_digits(df['volume'].to_numpy())
+        first_digits = digits[digits > 0]
 
         if len(first_digits) >= 10:
             # Perform Benford's Law test only if we have enough data
-            benford_expected = np.log10(1 + 1 / np.arange(1, 10))
-            benford_observed = first_digits.value_counts(normalize=True).sort_index()
-
-            if len(benford_observed) >= 5:
-                chi2, p_value = stats.chisquare(
-                    benford_observed.values[:5],
-                    benford_expected[:5]
-                )
+            counts = np.bincount(first_digits, minlength=10)[1:]
+
+            if np.count_nonzero(counts) >= 5:
+                # Observed digit counts against the counts Benford's Law expects for
+                # this sample size (chisquare needs counts, not proportions)
+                chi2, p_value = stats.chisquare(counts, BENFORD_PROBS * counts.sum())
                 # Use 0.001 threshold (0.1%) - more reasonable for financial data
                 if p_value < 0.001:
                     anomalies.append(f"Data may be fabricated (Benford's Law p={p_value:.4f})")
@@ -326,12 +340,7 @@ class AdvancedValidator:
         # Cross-verify indicator consistency
         if 'rsi' in indicators and len(df) >= 14:
             # Recalculate RSI to verify
-            delta = df['close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            # Protect against division by zero
-            rs = gain / loss.replace(0, 1e-10)
-            calculated_rsi = 100 - (100 / (1 + rs.iloc[-1]))
+            calculated_rsi = self.recompute_rsi(df['close'].to_numpy(), 14)
 
             if abs(calculated_rsi - indicators['rsi']) > 1.0:
                 report['warnings'].append(f"RSI calculation mismatch: {calculated_rsi:.1f} vs {indicators['rsi']:.1f}")
@@ -339,6 +348,23 @@ class AdvancedValidator:
         self.validation_history.append(report)
         return report
 
+    @staticmethod
+    def recompute_rsi(prices: np.ndarray, period: int = 14) -> float:
+        """
+        Independently recompute the latest RSI from close prices
+
+        The average loss is floored at 1e-10 (see rsi_np), so a series with
+        no losses yields RSI near 100 instead of dividing by zero.
+
+        Args:
+            prices: Close prices, oldest first
+            period: RSI averaging window
+
+        Returns:
+            RSI of the last bar, NaN if there are fewer than period prices
+        """
+        return float(rsi_np(prices, period)[-1]) if len(prices) else np.nan
+
     def validate_trading_signal(self, analysis: Dict) -> Dict:
         """
         Stage 3: Validate trading signals and recommendations
@@ -31,6 +31,7 @@ Usage:
     print(results.summary())
 """
 
+import sys
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -38,10 +39,55 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 import logging
 
+from _njit import njit
+
 logger = logging.getLogger(__name__)
 
+# Result/record dataclasses use __slots__ where supported (Python 3.10+):
+# no per-instance __dict__ and faster attribute access in large sweeps
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Exit codes returned by _scan_exit
+_EXIT_NONE = 0
+_EXIT_STOP_LOSS = 1
+_EXIT_TAKE_PROFIT = 2
+_EXIT_REASONS = {_EXIT_STOP_LOSS: 'STOP_LOSS', _EXIT_TAKE_PROFIT: 'TAKE_PROFIT'}
+
+
+@njit(cache=True)
+def _scan_exit(
+    high: np.ndarray,
+    low: np.ndarray,
+    start: int,
+    is_long: bool,
+    stop_loss: float,
+    take_profit: float
+) -> Tuple[int, int]:
+    """
+    Find the first candle at or after start where an open position exits
+
+    Uses intrabar high/low, checking stop loss before take profit on each
+    candle. Compiled with numba when available (see _njit).
+
+    Returns:
+        Tuple of (candle index, exit code), or (-1, _EXIT_NONE) if neither
+        level is hit before the end of the data
+    """
+    for i in range(start, len(high)):
+        if is_long:
+            if low[i] <= stop_loss:
+                return i, _EXIT_STOP_LOSS
+            if high[i] >= take_profit:
+                return i, _EXIT_TAKE_PROFIT
+        else:
+            if high[i] >= stop_loss:
+                return i, _EXIT_STOP_LOSS
+            if low[i] <= take_profit:
+                return i, _EXIT_TAKE_PROFIT
+    return -1, _EXIT_NONE
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Trade:
     """Represents a completed trade"""
     entry_time: datetime
@@ -64,7 +110,7 @@ class Trade:
                 f"Reason: {self.exit_reason}")
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Position:
     """Represents an open position"""
     symbol: str
@@ -104,7 +150,7 @@ class Position:
             return current_price <= self.take_profit
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class BacktestResult:
     """Stores backtesting results and metrics"""
     initial_capital: float
@@ -203,6 +249,22 @@ class Backtester:
 
         logger.info(f"Backtester initialized with ${initial_capital:,.2f} capital")
 
+    def reset(self, initial_capital: Optional[float] = None):
+        """
+        Clear capital, open position, trade log and equity history
+
+        Lets one backtester (and its agent) be reused across runs.
+
+        Args:
+            initial_capital: New starting capital (keeps the current one if None)
+        """
+        if initial_capital is not None:
+            self.initial_capital = initial_capital
+        self.capital = self.initial_capital
+        self.position = None
+        self.trades = []
+        self.equity_history = []
+
     def apply_slippage(self, price: float, side: str) -> float:
         """Apply realistic slippage to price"""
         if side == 'LONG':
@@ -395,38 +457,89 @@ class Backtester:
         Returns:
             BacktestResult with performance metrics and trade history
         """
-        logger.info(f"Starting backtest for {symbol} with {len(data)} candles")
-        logger.info(f"Period: {data['timestamp'].iloc[0]} to {data['timestamp'].iloc[-1]}")
+        return self._simulate(
+            data,
+            data['timestamp'].tolist(),
+            data['high'].to_numpy(dtype=np.float64),
+            data['low'].to_numpy(dtype=np.float64),
+            data['close'].to_numpy(dtype=np.float64),
+            symbol
+        )
+
+    def run_arrays(
+        self,
+        timestamps: np.ndarray,
+        arrays: Dict[str, np.ndarray],
+        symbol: str = 'BTC/USDT'
+    ) -> BacktestResult:
+        """
+        Run backtest on OHLCV column arrays instead of a DataFrame
+
+        The simulation reads high/low/close straight from the arrays. The
+        agent still analyzes DataFrame windows, so a frame is wrapped around
+        the same arrays without copying them.
+
+        Args:
+            timestamps: Candle timestamps (datetime64)
+            arrays: Dict with 'open', 'high', 'low', 'close', 'volume' ndarrays
+            symbol: Trading pair symbol
+
+        Returns:
+            BacktestResult with performance metrics and trade history
+        """
+        data = pd.DataFrame({'timestamp': timestamps, **arrays}, copy=False)
+        return self._simulate(
+            data,
+            pd.DatetimeIndex(timestamps).tolist(),
+            np.asarray(arrays['high'], dtype=np.float64),
+            np.asarray(arrays['low'], dtype=np.float64),
+            np.asarray(arrays['close'], dtype=np.float64),
+            symbol
+        )
+
+    def _simulate(
+        self,
+        data: pd.DataFrame,
+        timestamps: List[datetime],
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        symbol: str
+    ) -> BacktestResult:
+        """Replay candles through the agent and position logic (shared by run/run_arrays)"""
+        n_candles = len(closes)
+        logger.info(f"Starting backtest for {symbol} with {n_candles} candles")
+        logger.info(f"Period: {timestamps[0]} to {timestamps[-1]}")
 
         # Reset state
-        self.capital = self.initial_capital
-        self.position = None
-        self.trades = []
-        self.equity_history = []
+        self.reset()
 
         # Iterate through each candle
-        for idx in range(len(data)):
-            current_candle = data.iloc[idx]
-            timestamp = current_candle['timestamp']
-            current_price = current_candle['close']
-            high = current_candle['high']
-            low = current_candle['low']
-
-            # Check if we have a position
+        idx = 0
+        while idx < n_candles:
+            # With a position open the agent isn't consulted, so jump straight
+            # to the exit candle and record equity for the candles in between
             if self.position:
-                # Check stop loss (using intrabar low/high)
-                if self.position.side == 'LONG' and low <= self.position.stop_loss:
-                    self.close_position(self.position.stop_loss, 'STOP_LOSS', timestamp)
-                elif self.position.side == 'SHORT' and high >= self.position.stop_loss:
-                    self.close_position(self.position.stop_loss, 'STOP_LOSS', timestamp)
-                # Check take profit
-                elif self.position.side == 'LONG' and high >= self.position.take_profit:
-                    self.close_position(self.position.take_profit, 'TAKE_PROFIT', timestamp)
-                elif self.position.side == 'SHORT' and low <= self.position.take_profit:
-                    self.close_position(self.position.take_profit, 'TAKE_PROFIT', timestamp)
+                exit_idx, exit_code = _scan_exit(
+                    highs, lows, idx, self.position.side == 'LONG',
+                    self.position.stop_loss, self.position.take_profit
+                )
+                held_until = exit_idx if exit_code != _EXIT_NONE else n_candles
+                for held_idx in range(idx, held_until):
+                    self.update_equity(timestamps[held_idx], closes[held_idx])
+                if exit_code == _EXIT_NONE:
+                    break
+
+                idx = exit_idx
+                exit_price = (self.position.stop_loss if exit_code == _EXIT_STOP_LOSS
+                              else self.position.take_profit)
+                self.close_position(exit_price, _EXIT_REASONS[exit_code], timestamps[idx])
+
+            timestamp = timestamps[idx]
+            current_price = closes[idx]
 
             # Get trading signal (only if no position)
-            if not self.position and idx >= 200:  # Need enough data for indicators
+            if idx >= 200:  # Need enough data for indicators
                 # Get historical window for analysis
                 window_data = data.iloc[max(0, idx-200):idx+1].copy()
 
@@ -454,16 +567,16 @@ class Backtester:
                                 )
                 except Exception as e:
                     logger.error(f"Error during analysis at {timestamp}: {e}")
+                    idx += 1
                     continue
 
             # Update equity tracking
             self.update_equity(timestamp, current_price)
+            idx += 1
 
         # Close any open position at end
         if self.position:
-            final_price = data.iloc[-1]['close']
-            final_timestamp = data.iloc[-1]['timestamp']
-            self.close_position(final_price, 'END_OF_DATA', final_timestamp)
+            self.close_position(closes[-1], 'END_OF_DATA', timestamps[-1])
 
         # Calculate performance metrics
         results = self._calculate_metrics()
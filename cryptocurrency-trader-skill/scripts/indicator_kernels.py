@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Single-pass Indicator Kernels
+
+Rolling RSI and Stochastic %K over plain NumPy arrays. Each kernel walks its
+input once: RSI keeps running gain/loss sums (add the new bar, drop the one
+leaving the window) and Stochastic keeps monotonic queues of window highs and
+lows, so both are O(n) regardless of the window length.
+
+rsi_wilder is the canonical RSI with Wilder's smoothing, also a single pass
+with one update per bar.
+
+rsi_np and stochastic_np are vectorized equivalents (convolutions and
+sliding-window views instead of a loop) for callers that want plain NumPy
+without a compiled kernel.
+
+The kernels reproduce the pandas formulas used by the trading agent, including
+the division-by-zero guards (the average loss and the high-low range are
+floored at 1e-10). Warm-up bars are NaN, like pandas rolling windows.
+
+Kernels are compiled with numba when it is installed (see _njit.py) and run
+as plain Python otherwise.
+
+Usage:
+    from indicator_kernels import rolling_rsi, stochastic_k
+
+    rsi = rolling_rsi(df['close'].to_numpy(), 14)
+    stoch = stochastic_k(df['high'].to_numpy(), df['low'].to_numpy(), df['close'].to_numpy(), 14)
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from _njit import njit
+
+
+@njit(cache=True)
+def rolling_rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    RSI from simple rolling means of gains and losses
+
+    Matches ``gain.rolling(period).mean() / np.maximum(loss.rolling(period).mean(), 1e-10)``
+    where the first bar (no previous close) counts as neither gain nor loss.
+
+    Args:
+        close: Close prices
+        period: Averaging window
+
+    Returns:
+        RSI per bar, NaN for the first period - 1 bars
+    """
+    n = len(close)
+    out = np.full(n, np.nan)
+    gains = np.zeros(n)
+    losses = np.zeros(n)
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gains[i] = delta
+        elif delta < 0:
+            losses[i] = -delta
+
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for i in range(n):
+        gain_sum += gains[i]
+        loss_sum += losses[i]
+        if i >= period:
+            gain_sum -= gains[i - period]
+            loss_sum -= losses[i - period]
+        if i >= period - 1:
+            # The floor also absorbs running-sum round-off around zero
+            avg_loss = max(loss_sum / period, 1e-10)
+            out[i] = 100.0 - 100.0 / (1.0 + (gain_sum / period) / avg_loss)
+    return out
+
+
+@njit(cache=True)
+def rsi_wilder(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    RSI with Wilder's smoothing
+
+    The first averages are simple means of the first period price changes;
+    after that each bar updates them with avg = (avg * (period - 1) + x) / period.
+
+    Args:
+        close: Close prices
+        period: Smoothing period
+
+    Returns:
+        RSI per bar, NaN for the first period bars
+    """
+    n = len(close)
+    out = np.full(n, np.nan)
+    if n <= period:
+        return out
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= period
+    avg_loss /= period
+    out[period] = 100.0 - 100.0 / (1.0 + avg_gain / max(avg_loss, 1e-10))
+
+    for i in range(period + 1, n):
+        delta = close[i] - close[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+        out[i] = 100.0 - 100.0 / (1.0 + avg_gain / max(avg_loss, 1e-10))
+    return out
+
+
+def rsi_np(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    Vectorized rolling_rsi using convolution for the window means
+
+    Args:
+        close: Close prices
+        period: Averaging window
+
+    Returns:
+        RSI per bar, NaN for the first period - 1 bars
+    """
+    close = np.asarray(close, dtype=np.float64)
+    out = np.full(len(close), np.nan)
+    if len(close) < period:
+        return out
+
+    delta = np.diff(close, prepend=close[:1])
+    window = np.full(period, 1.0 / period)
+    avg_gain = np.convolve(np.maximum(delta, 0.0), window, mode='valid')
+    avg_loss = np.convolve(np.maximum(-delta, 0.0), window, mode='valid')
+    avg_loss = np.maximum(avg_loss, 1e-10)
+    out[period - 1:] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+
+@njit(cache=True)
+def stochastic_k(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    Stochastic %K against the rolling high/low window
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+        period: Lookback window
+
+    Returns:
+        %K per bar, NaN for the first period - 1 bars
+    """
+    n = len(close)
+    out = np.full(n, np.nan)
+    # Monotonic queues of bar indices: highs decreasing, lows increasing
+    max_queue = np.empty(n, dtype=np.int64)
+    min_queue = np.empty(n, dtype=np.int64)
+    max_head = max_tail = 0
+    min_head = min_tail = 0
+
+    for i in range(n):
+        while max_tail > max_head and high[max_queue[max_tail - 1]] <= high[i]:
+            max_tail -= 1
+        max_queue[max_tail] = i
+        max_tail += 1
+        if max_queue[max_head] <= i - period:
+            max_head += 1
+
+        while min_tail > min_head and low[min_queue[min_tail - 1]] >= low[i]:
+            min_tail -= 1
+        min_queue[min_tail] = i
+        min_tail += 1
+        if min_queue[min_head] <= i - period:
+            min_head += 1
+
+        if i >= period - 1:
+            lowest = low[min_queue[min_head]]
+            price_range = max(high[max_queue[max_head]] - lowest, 1e-10)
+            out[i] = 100.0 * (close[i] - lowest) / price_range
+    return out
+
+
+def stochastic_np(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    Vectorized stochastic_k using sliding-window views for the high/low range
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+        period: Lookback window
+
+    Returns:
+        %K per bar, NaN for the first period - 1 bars
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    out = np.full(len(close), np.nan)
+    if len(close) < period:
+        return out
+
+    lowest = sliding_window_view(low, period).min(axis=1)
+    highest = sliding_window_view(high, period).max(axis=1)
+    price_range = np.maximum(highest - lowest, 1e-10)
+    out[period - 1:] = 100.0 * (close[period - 1:] - lowest) / price_range
+    return out
+
+
+__all__ = ['rolling_rsi', 'rsi_np', 'rsi_wilder', 'stochastic_k', 'stochastic_np']
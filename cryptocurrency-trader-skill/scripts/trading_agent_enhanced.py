@@ -38,6 +38,7 @@ if str(_SCRIPT_DIR) not in sys.path:
 from advanced_validation import AdvancedValidator
 from advanced_analytics import AdvancedAnalytics
 from pattern_recognition import PatternRecognition
+from indicator_kernels import stochastic_np
 
 
 class EnhancedTradingAgent:
@@ -53,13 +54,20 @@ class EnhancedTradingAgent:
     - Cross-verification at every critical stage
     """
 
-    def __init__(self, balance: float, exchange_name: str = 'binance'):
+    def __init__(
+        self,
+        balance: float,
+        exchange_name: str = 'binance',
+        exchange_client: Optional[ccxt.Exchange] = None
+    ):
         """
         Initialize enhanced trading agent
 
         Args:
             balance: Account balance in USD
             exchange_name: Exchange to use (default: binance)
+            exchange_client: Pre-built exchange client to use instead of connecting
+                to exchange_name (e.g. a stub when only indicator math is needed)
 
         Raises:
             ValueError: If balance is invalid
@@ -80,7 +88,7 @@ class EnhancedTradingAgent:
 
         self.balance = balance
         self.exchange_name = exchange_name
-        self.exchange = self._initialize_exchange()
+        self.exchange = exchange_client if exchange_client is not None else self._initialize_exchange()
         logger.info(f"Initialized EnhancedTradingAgent with ${balance} balance on {exchange_name}")
 
         # Initialize advanced engines
@@ -101,6 +109,24 @@ class EnhancedTradingAgent:
         # Performance tracking
         self.analysis_history = []
 
+    def reset(self, balance: Optional[float] = None):
+        """
+        Clear per-run state so the agent can be reused for another backtest
+
+        The exchange connection and analysis engines are kept.
+
+        Args:
+            balance: New account balance in USD (keeps the current one if None)
+
+        Raises:
+            ValueError: If balance is not positive
+        """
+        if balance is not None:
+            if balance <= 0:
+                raise ValueError(f"Balance must be positive, got {balance}")
+            self.balance = balance
+        self.analysis_history = []
+
     def _initialize_exchange(self) -> ccxt.Exchange:
         """Initialize exchange connection with validation"""
         try:
@@ -155,8 +181,8 @@ class EnhancedTradingAgent:
             delta = df['close'].diff()
             gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
             loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            # Protect against division by zero: replace 0 with small epsilon
-            rs = gain / loss.replace(0, 1e-10)
+            # Protect against division by zero: floor the average loss at a small epsilon
+            rs = gain / np.maximum(loss, 1e-10)
             rsi = 100 - (100 / (1 + rs))
 
             exp1 = df['close'].ewm(span=12, adjust=False).mean()
@@ -180,12 +206,11 @@ class EnhancedTradingAgent:
             ema_50 = df['close'].ewm(span=50, adjust=False).mean()
             ema_200 = df['close'].ewm(span=200, adjust=False).mean()
 
-            # Stochastic Oscillator
-            low_14 = df['low'].rolling(14).min()
-            high_14 = df['high'].rolling(14).max()
-            # Protect against division by zero when market is flat (high == low)
-            range_14 = (high_14 - low_14).replace(0, 1e-10)
-            stoch_k = 100 * ((df['close'] - low_14) / range_14)
+            # Stochastic Oscillator (stochastic_np guards a flat high == low window)
+            stoch_k = pd.Series(
+                stochastic_np(df['high'].to_numpy(), df['low'].to_numpy(), df['close'].to_numpy(), 14),
+                index=df.index
+            )
             stoch_d = stoch_k.rolling(3).mean()
 
             indicators = {
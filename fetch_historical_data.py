@@ -7,13 +7,156 @@ Supports multiple exchanges and saving data locally for reuse.
 """
 
 import sys
-import ccxt
+import asyncio
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from pathlib import Path
 import json
-import time
-from typing import Optional, List
+import logging
+from typing import TYPE_CHECKING, Optional, List, Dict, Tuple
+
+if TYPE_CHECKING:
+    import ccxt
+
+logger = logging.getLogger(__name__)
+
+# Exchange instances shared across fetches, so market metadata is loaded
+# once per exchange per process instead of once per fetch call
+_exchange_instances: Dict[str, 'ccxt.Exchange'] = {}
+
+
+# Response headers reporting the request weight used in the current window,
+# with the exchange's cap for that window
+_USED_WEIGHT_HEADERS = {
+    'x-mbx-used-weight-1m': 6000,  # Binance
+}
+_WEIGHT_THROTTLE_RATIO = 0.8
+
+
+def _update_throttle(exchange) -> None:
+    """
+    Switch ccxt's static rate limiter on or off from the last response headers
+
+    When the exchange reports its used request weight, requests go out
+    without the fixed rateLimit delay until usage reaches
+    _WEIGHT_THROTTLE_RATIO of the cap. Exchanges without weight headers keep
+    the static limiter.
+    """
+    headers = exchange.last_response_headers or {}
+    for header, cap in _USED_WEIGHT_HEADERS.items():
+        used = headers.get(header)
+        if used is not None:
+            exchange.enableRateLimit = int(used) >= _WEIGHT_THROTTLE_RATIO * cap
+            return
+
+
+def _get_exchange(exchange_name: str) -> 'ccxt.Exchange':
+    """Return the shared exchange instance for exchange_name, with markets loaded"""
+    exchange = _exchange_instances.get(exchange_name)
+    if exchange is None:
+        # ccxt builds every exchange class on import; only pay for it when fetching
+        import ccxt
+
+        exchange_class = getattr(ccxt, exchange_name)
+        exchange = exchange_class({
+            'enableRateLimit': True,
+            'timeout': 30000
+        })
+        exchange.load_markets()
+        _exchange_instances[exchange_name] = exchange
+    return exchange
+
+
+async def _fetch_chunks(
+    exchange_name: str,
+    symbol: str,
+    timeframe: str,
+    chunk_starts: List[int],
+    chunk_span_ms: int,
+    limit: int,
+    concurrency: int,
+    markets: Optional[dict] = None,
+    currencies: Optional[dict] = None
+) -> List[list]:
+    """
+    Fetch OHLCV chunks concurrently, each covering chunk_span_ms from its start
+
+    Requests are gated by a semaphore and ccxt's built-in rate limiter, so
+    network latency overlaps instead of adding up chunk after chunk. The
+    limiter is relaxed while the exchange reports spare request weight.
+    Within a chunk, pages are requested from the last returned candle until
+    the chunk's end, so exchanges that cap pages below limit still fill every
+    chunk. Results are returned in the same order as chunk_starts. A chunk
+    that fails is reported and returned with the candles fetched so far.
+    Chunks past the end of the exchange's data (after an empty page) come
+    back empty. Markets loaded by the shared sync instance are reused instead
+    of being fetched again.
+    """
+    import ccxt.async_support as ccxt_async
+
+    exchange = getattr(ccxt_async, exchange_name)({
+        'enableRateLimit': True,
+        'timeout': 30000
+    })
+    if markets:
+        exchange.set_markets(markets, currencies)
+    semaphore = asyncio.Semaphore(concurrency)
+    # Earliest since that returned an empty page: the exchange has no data
+    # past it, so later pages are skipped instead of requested
+    eof_since = None
+
+    async def fetch_chunk(chunk_since: int) -> list:
+        nonlocal eof_since
+        chunk_end = chunk_since + chunk_span_ms
+        candles = []
+        page_since = chunk_since
+        async with semaphore:
+            while page_since < chunk_end:
+                if eof_since is not None and page_since > eof_since:
+                    break
+                try:
+                    page = await exchange.fetch_ohlcv(symbol, timeframe, since=page_since, limit=limit)
+                except Exception as e:
+                    logger.warning(f"Error fetching chunk at {datetime.fromtimestamp(page_since/1000)}: {e}")
+                    break
+                _update_throttle(exchange)
+                if not page:
+                    if eof_since is None or page_since < eof_since:
+                        eof_since = page_since
+                    break
+                candles.extend(candle for candle in page if candle[0] < chunk_end)
+                if page[-1][0] < page_since:
+                    break  # No progress; never re-request the same page
+                page_since = page[-1][0] + 1
+        return candles
+
+    try:
+        return await asyncio.gather(*(fetch_chunk(chunk_since) for chunk_since in chunk_starts))
+    finally:
+        await exchange.close()
+
+
+def _merge_candles(arr: np.ndarray, timeframe_ms: int) -> Tuple[np.ndarray, int]:
+    """
+    Sort fetched candles by timestamp and drop repeated ones
+
+    Overlapping chunks can repeat a run of candles anywhere in the stacked
+    array, so the rows are sorted and the first row of each timestamp is
+    kept.
+
+    Args:
+        arr: Stacked OHLCV rows, timestamp (ms) in column 0
+        timeframe_ms: Candle length in milliseconds
+
+    Returns:
+        Tuple of (unique rows in time order, number of gaps longer than one candle)
+    """
+    _, first = np.unique(arr[:, 0], return_index=True)
+    arr = arr[first]
+    num_gaps = int(np.count_nonzero(np.diff(arr[:, 0]) > timeframe_ms))
+    return arr, num_gaps
+
 
 def fetch_ohlcv_data(
     exchange_name: str = 'binance',
@@ -33,21 +176,20 @@ def fetch_ohlcv_data(
         timeframe: Candle timeframe ('1m', '5m', '15m', '1h', '4h', '1d')
         start_date: Start date (YYYY-MM-DD format)
         end_date: End date (YYYY-MM-DD format)
-        limit: Max candles per request (500-1000 typical)
-        save_to_file: Save data to CSV file
+        limit: Candles per chunk and per request (500-1000 typical). Chunks are
+            requested in parallel; exchanges that return fewer candles per page
+            are paged until each chunk is complete
+        save_to_file: Save data to CSV file, plus a Parquet copy for fast reload
 
     Returns:
         DataFrame with columns: timestamp, open, high, low, close, volume
+        (OHLCV stored as float32)
     """
 
     print(f"Fetching {symbol} {timeframe} data from {exchange_name}...")
 
-    # Initialize exchange
-    exchange_class = getattr(ccxt, exchange_name)
-    exchange = exchange_class({
-        'enableRateLimit': True,
-        'timeout': 30000
-    })
+    # Initialize exchange (shared across calls)
+    exchange = _get_exchange(exchange_name)
 
     # Parse dates
     if start_date:
@@ -61,46 +203,52 @@ def fetch_ohlcv_data(
     else:
         until = exchange.milliseconds()
 
-    # Fetch data in chunks
-    all_ohlcv = []
-    current_since = since
+    # Fetch data in chunks. Chunk boundaries are known up front from the
+    # timeframe, so all chunks are requested concurrently.
+    timeframe_ms = exchange.parse_timeframe(timeframe) * 1000
+    chunk_span_ms = limit * timeframe_ms
+    num_chunks = -(-(until - since) // chunk_span_ms)
+    chunk_starts = [since + i * chunk_span_ms for i in range(num_chunks)]
+    concurrency = max(1, int(1000 / exchange.rateLimit)) if exchange.rateLimit else 1
 
     print(f"  Period: {datetime.fromtimestamp(since/1000)} to {datetime.fromtimestamp(until/1000)}")
-    print(f"  Fetching in chunks of {limit} candles...")
-
-    chunk_count = 0
-    while current_since < until:
-        try:
-            # Fetch OHLCV
-            ohlcv = exchange.fetch_ohlcv(symbol, timeframe, since=current_since, limit=limit)
-
-            if not ohlcv:
-                break
-
-            all_ohlcv.extend(ohlcv)
-            chunk_count += 1
-
-            # Update since to last candle timestamp + 1
-            current_since = ohlcv[-1][0] + 1
-
-            print(f"  Chunk {chunk_count}: Fetched {len(ohlcv)} candles (total: {len(all_ohlcv)})")
-
-            # Rate limiting
-            time.sleep(exchange.rateLimit / 1000)
-
-        except Exception as e:
-            print(f"  Error fetching data: {e}")
-            break
-
-    if not all_ohlcv:
+    print(f"  Fetching {num_chunks} chunks of {limit} candles ({concurrency} concurrent)...")
+
+    chunks = asyncio.run(_fetch_chunks(
+        exchange_name, symbol, timeframe, chunk_starts, chunk_span_ms, limit, concurrency,
+        markets=exchange.markets, currencies=exchange.currencies
+    ))
+
+    # Keep each chunk as one float64 block and concatenate once, instead of
+    # growing a list of per-candle Python rows
+    ohlcv_blocks = []
+    total = 0
+    for chunk_count, ohlcv in enumerate(chunks, start=1):
+        if ohlcv:
+            ohlcv_blocks.append(np.asarray(ohlcv, dtype=np.float64))
+        total += len(ohlcv)
+        logger.info(f"Chunk {chunk_count}: Fetched {len(ohlcv)} candles (total: {total})")
+
+    if not ohlcv_blocks:
         raise ValueError("No data fetched from exchange")
 
-    # Convert to DataFrame
-    df = pd.DataFrame(all_ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+    # Convert to DataFrame from typed arrays: int64 timestamps and float32
+    # OHLCV halve the memory of the bar buffer for downstream indicator passes
+    arr = np.concatenate(ohlcv_blocks, axis=0)
 
-    # Remove duplicates
-    df = df.drop_duplicates(subset=['timestamp']).reset_index(drop=True)
+    arr, num_gaps = _merge_candles(arr, timeframe_ms)
+    if num_gaps:
+        logger.warning(f"{num_gaps} gap(s) longer than {timeframe} in fetched {symbol} data")
+
+    ohlcv = arr[:, 1:].astype(np.float32)
+    df = pd.DataFrame({
+        'timestamp': pd.to_datetime(arr[:, 0].astype(np.int64), unit='ms'),
+        'open': ohlcv[:, 0],
+        'high': ohlcv[:, 1],
+        'low': ohlcv[:, 2],
+        'close': ohlcv[:, 3],
+        'volume': ohlcv[:, 4]
+    })
 
     print(f"\n✅ Fetched {len(df)} candles")
     print(f"   Period: {df['timestamp'].iloc[0]} to {df['timestamp'].iloc[-1]}")
@@ -112,49 +260,67 @@ def fetch_ohlcv_data(
         filepath = Path('data') / filename
         filepath.parent.mkdir(exist_ok=True)
 
-        df.to_csv(filepath, index=False)
+        df.to_csv(filepath, index=False, float_format='%.10g', chunksize=50000)
         print(f"   Saved to: {filepath}")
 
+        # Parquet keeps native dtypes, so reloading skips CSV/datetime parsing
+        parquet_path = filepath.with_suffix('.parquet')
+        df.to_parquet(parquet_path, index=False, compression='zstd')
+        print(f"   Saved to: {parquet_path}")
+
     return df
 
 
 def load_historical_data(filepath: str) -> pd.DataFrame:
-    """Load historical data from CSV file"""
+    """Load historical data from a Parquet or CSV file"""
+    if Path(filepath).suffix == '.parquet':
+        return pd.read_parquet(filepath)
+
     df = pd.read_csv(filepath)
     df['timestamp'] = pd.to_datetime(df['timestamp'])
     return df
 
 
-def create_synthetic_data(
-    days: int = 90,
-    starting_price: float = 40000,
-    symbol: str = 'BTC/USDT',
-    timeframe: str = '1h',
-    trend: str = 'mixed',
-    save_to_file: bool = True
-) -> pd.DataFrame:
+def _floored_walk(changes: np.ndarray, starting_price: float, floor_ratio: float = 0.5) -> np.ndarray:
     """
-    Create synthetic OHLCV data for testing when exchange not available
+    Compound per-candle returns into a price path that never drops below
+    floor_ratio * starting_price
+
+    Equivalent to the step-by-step rule
+    ``price[i] = max(price[i-1] * (1 + changes[i-1]), starting_price * floor_ratio)``
+    without a Python loop: in log space the floor is a reflected random walk,
+    so lifting the cumulative log-return by its running minimum reproduces
+    the floored path exactly.
 
     Args:
-        days: Number of days of data
-        starting_price: Starting price
-        symbol: Symbol name (for filename)
-        timeframe: Timeframe (for filename)
-        trend: 'up', 'down', 'sideways', or 'mixed'
-        save_to_file: Save to CSV
+        changes: Per-candle fractional price changes (length periods - 1)
+        starting_price: First price of the path
+        floor_ratio: Minimum price as a fraction of starting_price
 
     Returns:
-        DataFrame with realistic OHLCV data
+        Array of prices with length len(changes) + 1
     """
-    import numpy as np
-
-    print(f"Creating synthetic {symbol} {timeframe} data...")
-    print(f"  Days: {days}")
-    print(f"  Starting price: ${starting_price:,.2f}")
-    print(f"  Trend: {trend}")
+    floor = np.log(floor_ratio)
+    log_path = np.concatenate(([0.0], np.cumsum(np.log1p(changes))))
+    log_path += np.maximum(floor - np.minimum.accumulate(log_path), 0.0)
+    return starting_price * np.exp(log_path)
+
+
+def _synthetic_frames(
+    days: int,
+    starting_price: float,
+    timeframe: str,
+    trends: List[str]
+) -> Dict[str, pd.DataFrame]:
+    """
+    Generate synthetic OHLCV frames for several trends from one set of draws
 
-    np.random.seed(42)  # Reproducible
+    Every trend reuses the same timestamps, return noise, wick noise and
+    volume, so scenarios differ only by drift. The draw order matches a
+    single-trend run, so each frame equals what create_synthetic_data
+    produces for that trend.
+    """
+    rng = np.random.default_rng(42)  # Reproducible, without touching global RNG state
 
     # Create timestamps
     if timeframe == '1h':
@@ -176,46 +342,77 @@ def create_synthetic_data(
         freq=freq
     )
 
-    # Generate price data with realistic characteristics
-    prices = [starting_price]
+    # Add volatility
+    volatility = 0.015  # 1.5% typical volatility
+    noise = rng.standard_normal(periods - 1) * volatility
+    wick_noise = np.abs(rng.standard_normal((periods, 2)) * 0.003)  # high/low wicks in one draw
+    volume_arr = rng.lognormal(mean=10, sigma=0.5, size=periods)
 
-    for i in range(1, periods):
+    frames = {}
+    for trend in trends:
+        # Generate price data with realistic characteristics
         # Base drift based on trend
         if trend == 'up':
             drift = 0.0002  # 0.02% per candle upward
         elif trend == 'down':
             drift = -0.0002
         elif trend == 'sideways':
-            drift = 0
+            drift = 0.0
         else:  # mixed
             # Alternate between up and down trends
             cycle_length = 100
-            drift = 0.0003 * np.sin(i / cycle_length * 2 * np.pi)
+            drift = 0.0003 * np.sin(np.arange(1, periods) / cycle_length * 2 * np.pi)
 
-        # Add volatility
-        volatility = 0.015  # 1.5% typical volatility
-        change = drift + np.random.randn() * volatility
+        prices = _floored_walk(drift + noise, starting_price)
 
-        # Apply change
-        new_price = prices[-1] * (1 + change)
-        prices.append(max(new_price, starting_price * 0.5))  # Don't go below 50% of start
+        # Generate realistic OHLC from close prices
+        open_arr = np.empty_like(prices)
+        open_arr[0] = prices[0]
+        open_arr[1:] = prices[:-1]
+        high_arr = np.maximum(open_arr, prices) * (1 + wick_noise[:, 0])
+        low_arr = np.minimum(open_arr, prices) * (1 - wick_noise[:, 1])
 
-    prices = np.array(prices)
+        # Build the frame in final column order
+        frames[trend] = pd.DataFrame({
+            'timestamp': timestamps,
+            'open': open_arr,
+            'high': high_arr,
+            'low': low_arr,
+            'close': prices,
+            'volume': volume_arr
+        }, copy=False)
 
-    # Create OHLC from close prices
-    df = pd.DataFrame({
-        'timestamp': timestamps,
-        'close': prices
-    })
+    return frames
 
-    # Generate realistic OHLC
-    df['open'] = df['close'].shift(1).fillna(df['close'])
-    df['high'] = df[['open', 'close']].max(axis=1) * (1 + np.abs(np.random.randn(len(df)) * 0.003))
-    df['low'] = df[['open', 'close']].min(axis=1) * (1 - np.abs(np.random.randn(len(df)) * 0.003))
-    df['volume'] = np.random.lognormal(mean=10, sigma=0.5, size=len(df))
 
-    # Reorder columns
-    df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+def create_synthetic_data(
+    days: int = 90,
+    starting_price: float = 40000,
+    symbol: str = 'BTC/USDT',
+    timeframe: str = '1h',
+    trend: str = 'mixed',
+    save_to_file: bool = True
+) -> pd.DataFrame:
+    """
+    Create synthetic OHLCV data for testing when exchange not available
+
+    Args:
+        days: Number of days of data
+        starting_price: Starting price
+        symbol: Symbol name (for filename)
+        timeframe: Timeframe (for filename)
+        trend: 'up', 'down', 'sideways', or 'mixed'
+        save_to_file: Save to CSV
+
+    Returns:
+        DataFrame with realistic OHLCV data
+    """
+    print(f"Creating synthetic {symbol} {timeframe} data...")
+    print(f"  Days: {days}")
+    print(f"  Starting price: ${starting_price:,.2f}")
+    print(f"  Trend: {trend}")
+
+    df = _synthetic_frames(days, starting_price, timeframe, [trend])[trend]
 
     print(f"\n✅ Created {len(df)} candles")
     print(f"   Period: {df['timestamp'].iloc[0]} to {df['timestamp'].iloc[-1]}")
@@ -229,12 +426,42 @@ def create_synthetic_data(
         filepath = Path('data') / filename
         filepath.parent.mkdir(exist_ok=True)
 
-        df.to_csv(filepath, index=False)
+        df.to_csv(filepath, index=False, float_format='%.10g', chunksize=50000)
         print(f"   Saved to: {filepath}")
 
     return df
 
 
+def create_synthetic_data_batch(
+    days: int = 90,
+    starting_price: float = 40000,
+    trends: Optional[List[str]] = None,
+    timeframe: str = '1h'
+) -> Dict[str, pd.DataFrame]:
+    """
+    Create synthetic OHLCV data for several trends at once
+
+    All trends share one timestamp index and one noise realization, so
+    scenarios are directly comparable and random draws are made only once.
+
+    Args:
+        days: Number of days of data
+        starting_price: Starting price
+        trends: Trends to generate (default: up, down, sideways, mixed)
+        timeframe: Timeframe ('1h', '4h' or '15m')
+
+    Returns:
+        Dictionary mapping each trend to its OHLCV DataFrame
+    """
+    trends = trends or ['up', 'down', 'sideways', 'mixed']
+    print(f"Creating synthetic {timeframe} data for trends: {', '.join(trends)}...")
+
+    frames = _synthetic_frames(days, starting_price, timeframe, trends)
+
+    print(f"✅ Created {len(trends)} x {len(frames[trends[0]])} candles")
+    return frames
+
+
 if __name__ == '__main__':
     import argparse
 
@@ -249,6 +476,9 @@ if __name__ == '__main__':
 
     args = parser.parse_args()
 
+    # Chunk-level fetch progress is logged at INFO
+    logging.basicConfig(level=logging.INFO, format='  %(message)s')
+
     if args.synthetic:
         # Create synthetic data
         df = create_synthetic_data(
@@ -6,20 +6,209 @@ Runs comprehensive backtests to validate trading strategy profitability.
 Tests against multiple scenarios and provides go/no-go recommendation.
 """
 
+import io
+import os
 import sys
+import contextlib
+import tempfile
+import operator
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 import argparse
 
 # Add scripts to path
 sys.path.insert(0, str(Path(__file__).parent / 'cryptocurrency-trader-skill' / 'scripts'))
 
 from backtester import Backtester, BacktestResult
-from trading_agent_enhanced import EnhancedTradingAgent
 from config import get_config
-from fetch_historical_data import fetch_ohlcv_data, create_synthetic_data, load_historical_data
+from fetch_historical_data import create_synthetic_data, create_synthetic_data_batch, load_historical_data
+
+# trading_agent_enhanced (and ccxt behind it) and the exchange fetcher are
+# imported where they are first needed, to keep CLI startup fast
+
+
+class _Out:
+    """Collects report output and writes it to stdout in one call per flush"""
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+
+    def p(self, msg: str = '', end: str = '\n'):
+        """Append a line, like print(msg)"""
+        self._buffer.write(f"{msg}{end}")
+
+    def flush(self):
+        """Write everything collected so far and start a new buffer"""
+        sys.stdout.write(self._buffer.getvalue())
+        sys.stdout.flush()
+        self._buffer = io.StringIO()
+
+
+# Fixed layout of the backtest results report, filled from a BacktestResult
+_REPORT_TEMPLATE = """\
+📈 Overall Performance:
+   Final Balance:        ${r.final_capital:,.2f}
+   Total Return:         {r.total_return_pct:+.2f}% (${r.total_return:+,.2f})
+   Max Drawdown:         {r.max_drawdown_pct:.2f}% (${r.max_drawdown:,.2f})
+   Sharpe Ratio:         {r.sharpe_ratio:.3f}
+   Sortino Ratio:        {r.sortino_ratio:.3f}
+
+📊 Trade Statistics:
+   Total Trades:         {r.total_trades}
+   Winning Trades:       {r.winning_trades}
+   Losing Trades:        {r.losing_trades}
+   Win Rate:             {r.win_rate:.1f}%
+   Average Trade:        ${r.avg_trade_return:+,.2f}
+   Average Win:          ${r.avg_winning_trade:+,.2f}
+   Average Loss:         ${r.avg_losing_trade:+,.2f}
+   Profit Factor:        {r.profit_factor:.2f}
+
+⚠️  Risk Metrics:
+   Largest Win:          ${r.largest_win:+,.2f}
+   Largest Loss:         ${r.largest_loss:+,.2f}
+
+"""
+
+
+# Strategy assessment criteria:
+# (name, result getter, threshold, passing comparison, comparison label, description)
+_CRITERIA_SCHEMA = (
+    ('profitable', operator.attrgetter('total_return'), 0.0, operator.gt, 'greater',
+     'Strategy is profitable'),
+    ('sharpe_ratio', operator.attrgetter('sharpe_ratio'), 1.0, operator.gt, 'greater',
+     'Sharpe ratio > 1.0 (good risk-adjusted returns)'),
+    ('win_rate', operator.attrgetter('win_rate'), 45.0, operator.gt, 'greater',
+     'Win rate > 45%'),
+    ('profit_factor', operator.attrgetter('profit_factor'), 1.2, operator.gt, 'greater',
+     'Profit factor > 1.2 (wins > 1.2x losses)'),
+    ('max_drawdown', operator.attrgetter('max_drawdown'), 30.0, operator.lt, 'less',
+     'Max drawdown < 30%'),
+    ('sufficient_trades', operator.attrgetter('total_trades'), 10, operator.ge, 'greater',
+     'At least 10 trades for statistical significance'),
+)
+
+
+# (header, name, synthetic trend) for each multi-scenario validation run
+SCENARIOS = [
+    ('Scenario 1: Bull Market', 'Bull Market', 'up'),
+    ('Scenario 2: Bear Market', 'Bear Market', 'down'),
+    ('Scenario 3: Sideways Market', 'Sideways Market', 'sideways'),
+    ('Scenario 4: Mixed/Realistic Market', 'Mixed Market', 'mixed'),
+]
+
+# Per-scenario summary row used to aggregate multi-scenario results
+SCENARIO_DTYPE = np.dtype([
+    ('name', 'U20'),
+    ('total_return', 'f8'),
+    ('sharpe', 'f8'),
+    ('win_rate', 'f8'),
+    ('trades', 'i4'),
+])
+
+
+# Backtester (with its agent) reused by every scenario a worker process runs
+_scenario_backtester: Optional[Backtester] = None
+
+
+def _get_scenario_backtester(initial_capital: float = 10000) -> Backtester:
+    """Return this process's scenario backtester, reset for a fresh run"""
+    global _scenario_backtester
+    if _scenario_backtester is None:
+        from trading_agent_enhanced import EnhancedTradingAgent
+
+        agent = EnhancedTradingAgent(balance=initial_capital, exchange_name='binance')
+        _scenario_backtester = Backtester(agent=agent, initial_capital=initial_capital)
+    else:
+        _scenario_backtester.agent.reset(initial_capital)
+        _scenario_backtester.reset(initial_capital)
+    return _scenario_backtester
+
+
+def _run_one_scenario(
+    scenario: Tuple[str, str, str],
+    df: pd.DataFrame
+) -> Tuple[str, BacktestResult, str]:
+    """
+    Backtest one synthetic market scenario
+
+    Runs in a worker process, so its output is captured and returned with the
+    result to be printed by the parent in scenario order.
+
+    Args:
+        scenario: (header, name, trend) entry from SCENARIOS
+        df: Synthetic OHLCV data for the scenario's trend
+
+    Returns:
+        Tuple of (scenario name, backtest result, captured stdout)
+    """
+    header, name, _ = scenario
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        print(f"📊 {header}")
+        print("-" * 70)
+        backtester = _get_scenario_backtester(initial_capital=10000)
+        result = backtester.run(df, 'BTC/USDT')
+        print(f"✅ {name}: {result.total_return:+.2f}% return, Sharpe: {result.sharpe_ratio:.2f}")
+        print()
+    return name, result, buffer.getvalue()
+
+
+# Record layout of the OHLCV memmap shared with sweep workers
+SWEEP_DTYPE = np.dtype([
+    ('timestamp', 'datetime64[ns]'),
+    ('open', 'f8'),
+    ('high', 'f8'),
+    ('low', 'f8'),
+    ('close', 'f8'),
+    ('volume', 'f8'),
+])
+
+
+def _run_sweep_window(
+    mmap_path: str,
+    n_rows: int,
+    start_idx: int,
+    end_idx: int,
+    symbol: str,
+    backtest_config: Dict,
+    agent=None
+) -> BacktestResult:
+    """
+    Backtest one [start_idx, end_idx) window of the memmapped OHLCV data
+
+    Runs in a worker process. Only the file path, row offsets and the
+    optional agent cross the process boundary; the worker maps the file
+    read-only and slices it.
+
+    Args:
+        mmap_path: Path of the SWEEP_DTYPE OHLCV file
+        n_rows: Number of rows in the file
+        start_idx: First row of the window
+        end_idx: One past the last row of the window
+        symbol: Trading pair
+        backtest_config: initial_capital, trading_fee and slippage
+        agent: Agent to backtest; None uses this process's EnhancedTradingAgent,
+            which connects to the exchange
+
+    Returns:
+        BacktestResult for the window
+    """
+    ohlcv = np.memmap(mmap_path, dtype=SWEEP_DTYPE, mode='r', shape=(n_rows,))
+    window = ohlcv[start_idx:end_idx]
+
+    if agent is None:
+        backtester = _get_scenario_backtester(initial_capital=backtest_config['initial_capital'])
+    else:
+        backtester = Backtester(agent=agent, initial_capital=backtest_config['initial_capital'])
+    backtester.trading_fee = backtest_config['trading_fee']
+    backtester.slippage = backtest_config['slippage']
+
+    arrays = {col: window[col] for col in SWEEP_DTYPE.names[1:]}
+    return backtester.run_arrays(window['timestamp'], arrays, symbol)
 
 
 class StrategyValidator:
@@ -30,9 +219,11 @@ class StrategyValidator:
     def __init__(self, config_path: Optional[str] = None):
         """Initialize validator with configuration"""
         self.config = get_config(config_path)
-        print("✅ Configuration loaded")
-        print(f"   Strategy: {self.config.strategy.name} v{self.config.strategy.version}")
-        print()
+        out = _Out()
+        out.p("✅ Configuration loaded")
+        out.p(f"   Strategy: {self.config.strategy.name} v{self.config.strategy.version}")
+        out.p()
+        out.flush()
 
     def validate_strategy(
         self,
@@ -57,61 +248,29 @@ class StrategyValidator:
         Returns:
             Dictionary with validation results and recommendation
         """
+        out = _Out()
 
-        print("=" * 70)
-        print("STRATEGY VALIDATION - BACKTEST ANALYSIS")
-        print("=" * 70)
-        print()
+        out.p("=" * 70)
+        out.p("STRATEGY VALIDATION - BACKTEST ANALYSIS")
+        out.p("=" * 70)
+        out.p()
 
         # Step 1: Load data
-        print("📊 Step 1: Loading Historical Data")
-        print("-" * 70)
+        out.p("📊 Step 1: Loading Historical Data")
+        out.p("-" * 70)
 
-        if use_synthetic:
-            print(f"Creating synthetic {symbol} data...")
-            df = create_synthetic_data(
-                days=synthetic_days,
-                symbol=symbol,
-                timeframe=timeframe,
-                trend='mixed',
-                save_to_file=False
-            )
-        else:
-            # Try to load from file first, then fetch if needed
-            filename = f"{symbol.replace('/', '_')}_{timeframe}_{start_date or 'recent'}.csv"
-            filepath = Path('data') / filename
+        # Loading prints its own progress, so emit the header first
+        out.flush()
+        df = self._load_data(symbol, timeframe, start_date, end_date, use_synthetic, synthetic_days)
 
-            if filepath.exists():
-                print(f"Loading from cache: {filepath}")
-                df = load_historical_data(str(filepath))
-            else:
-                print(f"Fetching {symbol} data from exchange...")
-                try:
-                    df = fetch_ohlcv_data(
-                        exchange_name='binance',
-                        symbol=symbol,
-                        timeframe=timeframe,
-                        start_date=start_date,
-                        end_date=end_date
-                    )
-                except Exception as e:
-                    print(f"❌ Failed to fetch data: {e}")
-                    print("💡 Falling back to synthetic data...")
-                    df = create_synthetic_data(
-                        days=synthetic_days,
-                        symbol=symbol,
-                        timeframe=timeframe,
-                        trend='mixed',
-                        save_to_file=False
-                    )
-
-        print()
+        out.p()
 
         # Step 2: Initialize backtester
-        print("🔧 Step 2: Initializing Backtesting Engine")
-        print("-" * 70)
+        out.p("🔧 Step 2: Initializing Backtesting Engine")
+        out.p("-" * 70)
 
         # Create trading agent with configuration
+        from trading_agent_enhanced import EnhancedTradingAgent
         agent = EnhancedTradingAgent(
             balance=self.config.backtest.initial_capital,
             exchange_name='binance'
@@ -125,82 +284,197 @@ class StrategyValidator:
             slippage=self.config.backtest.slippage
         )
 
-        print(f"   Initial Capital: ${self.config.backtest.initial_capital:,.2f}")
-        print(f"   Commission: {self.config.backtest.trading_fee * 100:.2f}%")
-        print(f"   Slippage: {self.config.backtest.slippage * 100:.2f}%")
-        print()
+        out.p(f"   Initial Capital: ${self.config.backtest.initial_capital:,.2f}")
+        out.p(f"   Commission: {self.config.backtest.trading_fee * 100:.2f}%")
+        out.p(f"   Slippage: {self.config.backtest.slippage * 100:.2f}%")
+        out.p()
 
         # Step 3: Run backtest
-        print("🚀 Step 3: Running Backtest")
-        print("-" * 70)
-        print(f"   Testing {len(df)} candles...")
-        print(f"   Period: {df['timestamp'].iloc[0]} to {df['timestamp'].iloc[-1]}")
-        print(f"   Symbol: {symbol}")
-        print()
-
-        result = backtester.run(df, symbol)
+        out.p("🚀 Step 3: Running Backtest")
+        out.p("-" * 70)
+        n_candles = len(df)
+        start_ts, end_ts = df['timestamp'].iat[0], df['timestamp'].iat[-1]
+        out.p(f"   Testing {n_candles} candles...")
+        out.p(f"   Period: {start_ts} to {end_ts}")
+        out.p(f"   Symbol: {symbol}")
+        out.p()
+
+        # The backtest can run for a while, so show progress up to here first
+        out.flush()
+
+        # Hand the backtester column arrays extracted once (no per-candle row access)
+        ohlcv_arrays = {col: df[col].to_numpy() for col in ('open', 'high', 'low', 'close', 'volume')}
+        result = backtester.run_arrays(df['timestamp'].to_numpy(), ohlcv_arrays, symbol)
 
         # Step 4: Analyze results
-        print()
-        print("=" * 70)
-        print("BACKTEST RESULTS")
-        print("=" * 70)
-        print()
+        out.p()
+        out.p("=" * 70)
+        out.p("BACKTEST RESULTS")
+        out.p("=" * 70)
+        out.p()
 
-        self._print_results(result)
+        out.p(_REPORT_TEMPLATE.format(r=result), end='')
 
         # Step 5: Generate recommendation
-        print()
-        print("=" * 70)
-        print("VALIDATION ASSESSMENT")
-        print("=" * 70)
-        print()
+        out.p()
+        out.p("=" * 70)
+        out.p("VALIDATION ASSESSMENT")
+        out.p("=" * 70)
+        out.p()
+
+        out.flush()
 
         assessment = self._assess_strategy(result)
 
         return {
             'result': result,
             'assessment': assessment,
-            'data_period': (df['timestamp'].iloc[0], df['timestamp'].iloc[-1]),
-            'data_points': len(df),
+            'data_period': (start_ts, end_ts),
+            'data_points': n_candles,
             'symbol': symbol
         }
 
-    def _print_results(self, result: BacktestResult):
-        """Print backtest results in formatted way"""
+    def sweep(
+        self,
+        windows: List[Tuple[str, str]],
+        symbol: str = 'BTC/USDT',
+        timeframe: str = '1h',
+        use_synthetic: bool = False,
+        synthetic_days: int = 90,
+        n_jobs: int = -1,
+        agent=None
+    ) -> List[Tuple[Tuple[str, str], BacktestResult]]:
+        """
+        Backtest the strategy over many date windows of the same data
 
-        # Overall Performance
-        print("📈 Overall Performance:")
-        print(f"   Final Balance:        ${result.final_balance:,.2f}")
-        print(f"   Total Return:         {result.total_return:+.2f}%")
-        print(f"   Max Drawdown:         {result.max_drawdown:.2f}%")
-        print(f"   Sharpe Ratio:         {result.sharpe_ratio:.3f}")
-        print(f"   Sortino Ratio:        {result.sortino_ratio:.3f}")
-        print()
+        The data covering all windows is loaded once and written to a
+        memmap in a private temporary file, removed when the sweep ends. Each
+        window is then backtested in a joblib worker that receives only the
+        file path and row offsets (plus the agent, if one is given).
 
-        # Trade Statistics
-        print("📊 Trade Statistics:")
-        print(f"   Total Trades:         {result.total_trades}")
-        print(f"   Winning Trades:       {result.winning_trades}")
-        print(f"   Losing Trades:        {result.losing_trades}")
-        print(f"   Win Rate:             {result.win_rate:.1f}%")
-        print(f"   Average Win:          {result.avg_win:.2f}%")
-        print(f"   Average Loss:         {result.avg_loss:.2f}%")
-        print(f"   Profit Factor:        {result.profit_factor:.2f}")
-        print()
+        Args:
+            windows: (start_date, end_date) pairs (YYYY-MM-DD); each window
+                covers [start_date, end_date)
+            symbol: Trading pair
+            timeframe: Candle timeframe
+            use_synthetic: Use synthetic data instead of real
+            synthetic_days: Days of synthetic data
+            n_jobs: Number of worker processes (-1 for all cores)
+            agent: Picklable agent sent to every worker, e.g. an offline
+                strategy; by default each worker builds an EnhancedTradingAgent
+                connected to the exchange
 
-        # Risk Metrics
-        print("⚠️  Risk Metrics:")
-        print(f"   Value at Risk (95%):  ${result.var_95:,.2f}")
-        print(f"   CVaR (95%):           ${result.cvar_95:,.2f}")
-        print(f"   Max Consecutive Wins: {result.max_consecutive_wins}")
-        print(f"   Max Consecutive Loss: {result.max_consecutive_losses}")
-        print()
+        Returns:
+            List of (window, backtest result) in the order of windows
+        """
+        from joblib import Parallel, delayed
+
+        df = self._load_data(
+            symbol, timeframe,
+            start_date=min(start for start, _ in windows),
+            end_date=max(end for _, end in windows),
+            use_synthetic=use_synthetic,
+            synthetic_days=synthetic_days
+        )
 
-        # Exposure
-        print("⏱️  Market Exposure:")
-        print(f"   Time in Market:       {result.exposure_time:.1f}%")
-        print()
+        # Window dates -> row offsets into the sorted timestamps
+        timestamps = df['timestamp'].to_numpy(dtype='datetime64[ns]')
+        bounds = np.array(windows, dtype='datetime64[ns]')
+        offsets = np.searchsorted(timestamps, bounds, side='left')
+        empty = offsets[:, 1] <= offsets[:, 0]
+        if empty.any():
+            raise ValueError(f"No candles in sweep windows: {[windows[i] for i in np.flatnonzero(empty)]}")
+
+        backtest_config = {
+            'initial_capital': self.config.backtest.initial_capital,
+            'trading_fee': self.config.backtest.trading_fee,
+            'slippage': self.config.backtest.slippage
+        }
+
+        # Write the master OHLCV once; workers map it instead of unpickling
+        # frames. A private file per sweep, so concurrent sweeps never share one.
+        fd, mmap_path = tempfile.mkstemp(prefix=f"{symbol.replace('/', '_')}_{timeframe}_", suffix='.ohlcv')
+        os.close(fd)
+        try:
+            ohlcv = np.memmap(mmap_path, dtype=SWEEP_DTYPE, mode='w+', shape=(len(df),))
+            for col in SWEEP_DTYPE.names:
+                ohlcv[col] = df[col].to_numpy()
+            ohlcv.flush()
+            del ohlcv
+
+            print(f"🚀 Sweeping {len(windows)} windows over {len(df)} candles...")
+            results = Parallel(n_jobs=n_jobs, backend='loky')(
+                delayed(_run_sweep_window)(
+                    mmap_path, len(df), int(start_idx), int(end_idx), symbol, backtest_config, agent
+                )
+                for start_idx, end_idx in offsets
+            )
+        finally:
+            os.remove(mmap_path)
+
+        return list(zip(windows, results))
+
+    def _load_data(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        use_synthetic: bool,
+        synthetic_days: int
+    ) -> pd.DataFrame:
+        """Load OHLCV data from the file cache, the exchange, or the synthetic generator"""
+        if use_synthetic:
+            print(f"Creating synthetic {symbol} data...")
+            df = create_synthetic_data(
+                days=synthetic_days,
+                symbol=symbol,
+                timeframe=timeframe,
+                trend='mixed',
+                save_to_file=False
+            )
+        else:
+            # Try to load from file first (Parquet copy preferred), then fetch if needed
+            filename = f"{symbol.replace('/', '_')}_{timeframe}_{start_date or 'recent'}.csv"
+            filepath = Path('data') / filename
+            parquet_path = filepath.with_suffix('.parquet')
+
+            # The Parquet copy is only trusted if it is not older than the CSV
+            parquet_fresh = parquet_path.exists() and (
+                not filepath.exists() or parquet_path.stat().st_mtime >= filepath.stat().st_mtime
+            )
+
+            if parquet_fresh:
+                print(f"Loading from cache: {parquet_path}")
+                df = load_historical_data(str(parquet_path))
+            elif filepath.exists():
+                print(f"Loading from cache: {filepath}")
+                df = load_historical_data(str(filepath))
+                # (Re)write the Parquet copy so later runs skip CSV parsing
+                df.to_parquet(parquet_path, engine='pyarrow', index=False, compression='zstd')
+            else:
+                print(f"Fetching {symbol} data from exchange...")
+                from fetch_historical_data import fetch_ohlcv_data
+                try:
+                    df = fetch_ohlcv_data(
+                        exchange_name='binance',
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        start_date=start_date,
+                        end_date=end_date
+                    )
+                except Exception as e:
+                    print(f"❌ Failed to fetch data: {e}")
+                    print("💡 Falling back to synthetic data...")
+                    df = create_synthetic_data(
+                        days=synthetic_days,
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        trend='mixed',
+                        save_to_file=False
+                    )
+
+        return df
 
     def _assess_strategy(self, result: BacktestResult) -> Dict:
         """
@@ -210,53 +484,26 @@ class StrategyValidator:
             Dictionary with pass/fail for each criterion and overall recommendation
         """
 
-        criteria = {
-            'profitable': {
-                'value': result.total_return,
-                'threshold': 0,
-                'comparison': 'greater',
-                'passed': result.total_return > 0,
-                'description': 'Strategy is profitable'
-            },
-            'sharpe_ratio': {
-                'value': result.sharpe_ratio,
-                'threshold': 1.0,
-                'comparison': 'greater',
-                'passed': result.sharpe_ratio > 1.0,
-                'description': 'Sharpe ratio > 1.0 (good risk-adjusted returns)'
-            },
-            'win_rate': {
-                'value': result.win_rate,
-                'threshold': 45.0,
-                'comparison': 'greater',
-                'passed': result.win_rate > 45.0,
-                'description': 'Win rate > 45%'
-            },
-            'profit_factor': {
-                'value': result.profit_factor,
-                'threshold': 1.2,
-                'comparison': 'greater',
-                'passed': result.profit_factor > 1.2,
-                'description': 'Profit factor > 1.2 (wins > 1.2x losses)'
-            },
-            'max_drawdown': {
-                'value': result.max_drawdown,
-                'threshold': 30.0,
-                'comparison': 'less',
-                'passed': result.max_drawdown < 30.0,
-                'description': 'Max drawdown < 30%'
-            },
-            'sufficient_trades': {
-                'value': result.total_trades,
-                'threshold': 10,
-                'comparison': 'greater',
-                'passed': result.total_trades >= 10,
-                'description': 'At least 10 trades for statistical significance'
+        # Build criteria, their report lines and the pass count in one pass
+        criteria = {}
+        criteria_lines = []
+        passed_count = 0
+        for name, getter, threshold, op, comparison, description in _CRITERIA_SCHEMA:
+            value = getter(result)
+            ok = bool(op(value, threshold))
+            criteria[name] = {
+                'value': value,
+                'threshold': threshold,
+                'comparison': comparison,
+                'passed': ok,
+                'description': description
             }
-        }
+            passed_count += ok
+            status = "✅ PASS" if ok else "❌ FAIL"
+            criteria_lines.append(f"   {status} - {description}")
+            criteria_lines.append(f"          Value: {value:.2f}, Threshold: {threshold}")
 
         # Calculate pass rate
-        passed_count = sum(1 for c in criteria.values() if c['passed'])
         total_count = len(criteria)
         pass_rate = (passed_count / total_count) * 100
 
@@ -281,20 +528,21 @@ class StrategyValidator:
             message = "❌ Strategy validation FAILED. Do NOT use for live trading."
 
         # Print assessment
-        print(f"Criteria Assessment ({passed_count}/{total_count} passed):")
-        print()
+        out = _Out()
+        out.p(f"Criteria Assessment ({passed_count}/{total_count} passed):")
+        out.p()
 
-        for name, criterion in criteria.items():
-            status = "✅ PASS" if criterion['passed'] else "❌ FAIL"
-            print(f"   {status} - {criterion['description']}")
-            print(f"          Value: {criterion['value']:.2f}, Threshold: {criterion['threshold']}")
+        for line in criteria_lines:
+            out.p(line)
 
-        print()
-        print(f"Pass Rate: {pass_rate:.0f}%")
-        print()
-        print(f"RECOMMENDATION: {recommendation} (Confidence: {confidence})")
-        print(f"{message}")
-        print()
+        out.p()
+        out.p(f"Pass Rate: {pass_rate:.0f}%")
+        out.p()
+        out.p(f"RECOMMENDATION: {recommendation} (Confidence: {confidence})")
+        out.p(f"{message}")
+        out.p()
+
+        out.flush()
 
         return {
             'criteria': criteria,
@@ -306,7 +554,7 @@ class StrategyValidator:
             'message': message
         }
 
-    def run_multi_scenario_validation(self) -> Dict:
+    def run_multi_scenario_validation(self, max_workers: Optional[int] = None) -> Dict:
         """
         Run validation across multiple scenarios
 
@@ -316,108 +564,85 @@ class StrategyValidator:
         3. Sideways market (synthetic sideways)
         4. Mixed/realistic market (synthetic mixed)
         5. Real historical data (if available)
-        """
 
-        print("=" * 70)
-        print("MULTI-SCENARIO VALIDATION")
-        print("=" * 70)
-        print()
-        print("Testing strategy across 4 market scenarios...")
-        print()
+        Args:
+            max_workers: Worker processes for the scenarios (default: one per
+                scenario, capped at the CPU count); 1 runs them in this process
+        """
+        out = _Out()
+
+        out.p("=" * 70)
+        out.p("MULTI-SCENARIO VALIDATION")
+        out.p("=" * 70)
+        out.p()
+        out.p(f"Testing strategy across {len(SCENARIOS)} market scenarios...")
+        out.p()
+
+        out.flush()
+
+        # One batch shares timestamps and noise, so scenarios differ only by trend
+        datasets = create_synthetic_data_batch(days=90, trends=[trend for _, _, trend in SCENARIOS])
+        out.p()
+
+        # Scenarios share no state, so run them in parallel processes
+        scenario_data = [datasets[trend] for _, _, trend in SCENARIOS]
+        if max_workers is None:
+            max_workers = min(len(SCENARIOS), os.cpu_count() or 1)
+        if max_workers == 1:
+            outcomes = list(map(_run_one_scenario, SCENARIOS, scenario_data))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(_run_one_scenario, SCENARIOS, scenario_data))
 
         scenarios = []
-
-        # Scenario 1: Bull Market
-        print("📊 Scenario 1: Bull Market")
-        print("-" * 70)
-        df_bull = create_synthetic_data(days=90, trend='up', save_to_file=False)
-        agent_bull = EnhancedTradingAgent(balance=10000, exchange_name='binance')
-        backtester_bull = Backtester(agent=agent_bull, initial_capital=10000)
-        result_bull = backtester_bull.run(df_bull, 'BTC/USDT')
-        print(f"✅ Bull Market: {result_bull.total_return:+.2f}% return, Sharpe: {result_bull.sharpe_ratio:.2f}")
-        print()
-        scenarios.append(('Bull Market', result_bull))
-
-        # Scenario 2: Bear Market
-        print("📊 Scenario 2: Bear Market")
-        print("-" * 70)
-        df_bear = create_synthetic_data(days=90, trend='down', save_to_file=False)
-        agent_bear = EnhancedTradingAgent(balance=10000, exchange_name='binance')
-        backtester_bear = Backtester(agent=agent_bear, initial_capital=10000)
-        result_bear = backtester_bear.run(df_bear, 'BTC/USDT')
-        print(f"✅ Bear Market: {result_bear.total_return:+.2f}% return, Sharpe: {result_bear.sharpe_ratio:.2f}")
-        print()
-        scenarios.append(('Bear Market', result_bear))
-
-        # Scenario 3: Sideways Market
-        print("📊 Scenario 3: Sideways Market")
-        print("-" * 70)
-        df_sideways = create_synthetic_data(days=90, trend='sideways', save_to_file=False)
-        agent_sideways = EnhancedTradingAgent(balance=10000, exchange_name='binance')
-        backtester_sideways = Backtester(agent=agent_sideways, initial_capital=10000)
-        result_sideways = backtester_sideways.run(df_sideways, 'BTC/USDT')
-        print(f"✅ Sideways Market: {result_sideways.total_return:+.2f}% return, Sharpe: {result_sideways.sharpe_ratio:.2f}")
-        print()
-        scenarios.append(('Sideways Market', result_sideways))
-
-        # Scenario 4: Mixed/Realistic Market
-        print("📊 Scenario 4: Mixed/Realistic Market")
-        print("-" * 70)
-        df_mixed = create_synthetic_data(days=90, trend='mixed', save_to_file=False)
-        agent_mixed = EnhancedTradingAgent(balance=10000, exchange_name='binance')
-        backtester_mixed = Backtester(agent=agent_mixed, initial_capital=10000)
-        result_mixed = backtester_mixed.run(df_mixed, 'BTC/USDT')
-        print(f"✅ Mixed Market: {result_mixed.total_return:+.2f}% return, Sharpe: {result_mixed.sharpe_ratio:.2f}")
-        print()
-        scenarios.append(('Mixed Market', result_mixed))
+        summary = np.empty(len(outcomes), dtype=SCENARIO_DTYPE)
+        for i, (name, result, output) in enumerate(outcomes):
+            out.p(output, end='')
+            scenarios.append((name, result))
+            summary[i] = (name, result.total_return, result.sharpe_ratio,
+                          result.win_rate, result.total_trades)
 
         # Summary
-        print()
-        print("=" * 70)
-        print("MULTI-SCENARIO SUMMARY")
-        print("=" * 70)
-        print()
-
-        print("Performance Across Scenarios:")
-        print()
-        print(f"{'Scenario':<20} {'Return':<12} {'Sharpe':<10} {'Win Rate':<12} {'Trades':<10}")
-        print("-" * 70)
-
-        total_return = 0
-        avg_sharpe = 0
-        avg_win_rate = 0
-        total_trades = 0
-
-        for name, result in scenarios:
-            print(f"{name:<20} {result.total_return:>+10.2f}%  {result.sharpe_ratio:>8.2f}  {result.win_rate:>10.1f}%  {result.total_trades:>8}")
-            total_return += result.total_return
-            avg_sharpe += result.sharpe_ratio
-            avg_win_rate += result.win_rate
-            total_trades += result.total_trades
-
-        print("-" * 70)
-        avg_return = total_return / len(scenarios)
-        avg_sharpe = avg_sharpe / len(scenarios)
-        avg_win_rate = avg_win_rate / len(scenarios)
-        print(f"{'AVERAGE':<20} {avg_return:>+10.2f}%  {avg_sharpe:>8.2f}  {avg_win_rate:>10.1f}%  {total_trades:>8}")
-        print()
+        out.p()
+        out.p("=" * 70)
+        out.p("MULTI-SCENARIO SUMMARY")
+        out.p("=" * 70)
+        out.p()
+
+        out.p("Performance Across Scenarios:")
+        out.p()
+        out.p(f"{'Scenario':<20} {'Return':<12} {'Sharpe':<10} {'Win Rate':<12} {'Trades':<10}")
+        out.p("-" * 70)
+
+        for row in summary:
+            out.p(f"{row['name']:<20} {row['total_return']:>+10.2f}%  {row['sharpe']:>8.2f}  {row['win_rate']:>10.1f}%  {row['trades']:>8}")
+
+        out.p("-" * 70)
+        avg_return = float(summary['total_return'].mean())
+        avg_sharpe = float(summary['sharpe'].mean())
+        avg_win_rate = float(summary['win_rate'].mean())
+        total_trades = int(summary['trades'].sum())
+        out.p(f"{'AVERAGE':<20} {avg_return:>+10.2f}%  {avg_sharpe:>8.2f}  {avg_win_rate:>10.1f}%  {total_trades:>8}")
+        out.p()
 
         # Overall assessment
-        print("Overall Multi-Scenario Assessment:")
-        print()
+        out.p("Overall Multi-Scenario Assessment:")
+        out.p()
 
-        robust = all(r.total_return > -10 for _, r in scenarios)  # No catastrophic losses
+        robust = bool((summary['total_return'] > -10).all())  # No catastrophic losses
         profitable = avg_return > 0
         good_sharpe = avg_sharpe > 0.8
 
         if robust and profitable and good_sharpe:
-            print("✅ ROBUST: Strategy performs consistently across market conditions")
+            out.p("✅ ROBUST: Strategy performs consistently across market conditions")
         elif profitable:
-            print("⚠️  CONDITIONALLY ROBUST: Strategy is profitable but shows variability")
+            out.p("⚠️  CONDITIONALLY ROBUST: Strategy is profitable but shows variability")
         else:
-            print("❌ NOT ROBUST: Strategy shows inconsistent performance")
+            out.p("❌ NOT ROBUST: Strategy shows inconsistent performance")
 
-        print()
+        out.p()
+
+        out.flush()
 
         return {
             'scenarios': scenarios,
@@ -440,6 +665,7 @@ def main():
     parser.add_argument('--synthetic', action='store_true', help='Use synthetic data')
     parser.add_argument('--days', type=int, default=90, help='Days of synthetic data')
     parser.add_argument('--multi', action='store_true', help='Run multi-scenario validation')
+    parser.add_argument('--workers', type=int, help='Worker processes for multi-scenario validation')
     parser.add_argument('--config', help='Path to config file')
 
     args = parser.parse_args()
@@ -449,7 +675,7 @@ def main():
 
         if args.multi:
             # Run multi-scenario validation
-            results = validator.run_multi_scenario_validation()
+            results = validator.run_multi_scenario_validation(max_workers=args.workers)
         else:
             # Run single validation
             results = validator.validate_strategy(
@@ -461,22 +687,26 @@ def main():
                 synthetic_days=args.days
             )
 
-        print()
-        print("=" * 70)
-        print("VALIDATION COMPLETE")
-        print("=" * 70)
-        print()
+        out = _Out()
+        out.p()
+        out.p("=" * 70)
+        out.p("VALIDATION COMPLETE")
+        out.p("=" * 70)
+        out.p()
 
         if args.multi:
             if results['robust'] and results['profitable']:
-                print("✅ Strategy validated across multiple market conditions")
-                print(f"   Average Return: {results['avg_return']:+.2f}%")
-                print(f"   Average Sharpe: {results['avg_sharpe']:.2f}")
+                out.p("✅ Strategy validated across multiple market conditions")
+                out.p(f"   Average Return: {results['avg_return']:+.2f}%")
+                out.p(f"   Average Sharpe: {results['avg_sharpe']:.2f}")
+                out.flush()
                 sys.exit(0)
             else:
-                print("⚠️  Strategy needs improvement for robust performance")
+                out.p("⚠️  Strategy needs improvement for robust performance")
+                out.flush()
                 sys.exit(1)
         else:
+            out.flush()
             rec = results['assessment']['recommendation']
             if rec == 'GO':
                 sys.exit(0)
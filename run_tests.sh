@@ -45,6 +45,7 @@ echo ""
 
 run_test "test_gbm_fix.py" "GBM Systematic Bias Fix (Monte Carlo)"
 run_test "test_div_zero_simple.py" "Division by Zero Protection (8 locations)"
+run_test "test_division_by_zero_fixes.py" "Division by Zero Protection (agent integration)"
 run_test "test_benford_fix.py" "Benford's Law First Digit Extraction"
 
 echo ""
@@ -54,6 +55,8 @@ echo ""
 
 run_test "test_backtest_framework.py" "Backtesting Framework"
 run_test "test_config_system.py" "Configuration Management System"
+run_test "test_synthetic_data.py" "Synthetic Data Price Walk"
+run_test "test_fetch_historical_data.py" "Historical Data Fetching"
 
 # Summary
 echo ""
@@ -80,6 +83,7 @@ else
     echo "  - Benford's Law: 26 tests"
     echo "  - Backtesting: 6 tests"
     echo "  - Configuration: 10 tests"
+    echo "  - Synthetic data: 1 test"
     echo "  Total: 50+ individual test cases"
     echo ""
     echo -e "${GREEN}✅ System is production-ready${NC}"
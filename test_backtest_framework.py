@@ -1,19 +1,22 @@
 #!/usr/bin/env python3
 """
 Test the backtesting framework with synthetic and historical data
+
+Run with pytest, or directly: python test_backtest_framework.py
 """
 
 import sys
 import numpy as np
 import pandas as pd
+import pytest
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 
-# Add scripts to path
+# Add scripts (and the repo root, for run_backtest) to path
 sys.path.insert(0, str(Path(__file__).parent / 'cryptocurrency-trader-skill' / 'scripts'))
+sys.path.insert(1, str(Path(__file__).parent))
 
 from backtester import Backtester, Position, Trade
-from trading_agent_enhanced import EnhancedTradingAgent
 
 def create_synthetic_data(days=30, starting_price=100, trend='sideways'):
     """
@@ -24,50 +27,44 @@ def create_synthetic_data(days=30, starting_price=100, trend='sideways'):
         starting_price: Starting price
         trend: 'up', 'down', or 'sideways'
     """
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
 
     # Create timestamps (hourly data)
-    timestamps = [datetime(2024, 1, 1) + timedelta(hours=i) for i in range(days * 24)]
-
-    prices = []
-    current_price = starting_price
+    timestamps = pd.date_range('2024-01-01', periods=days * 24, freq='h')
 
-    for i in range(len(timestamps)):
-        # Add trend
-        if trend == 'up':
-            drift = 0.001  # 0.1% upward drift per hour
-        elif trend == 'down':
-            drift = -0.001  # 0.1% downward drift per hour
-        else:  # sideways
-            drift = 0
+    # Add trend
+    if trend == 'up':
+        drift = 0.001  # 0.1% upward drift per hour
+    elif trend == 'down':
+        drift = -0.001  # 0.1% downward drift per hour
+    else:  # sideways
+        drift = 0
 
-        # Add random walk
-        change = drift + np.random.randn() * 0.01  # 1% volatility
-        current_price *= (1 + change)
-        prices.append(current_price)
+    # Random walk compounded in one pass
+    changes = drift + rng.standard_normal(len(timestamps)) * 0.01  # 1% volatility
+    prices = starting_price * np.cumprod(1 + changes)
 
-    prices = np.array(prices)
+    # Open/high/low jitter from one draw (high/low wicks are one-sided)
+    jitter = rng.standard_normal((len(prices), 3))
+    np.abs(jitter[:, 1:], out=jitter[:, 1:])
+    volume = rng.integers(1000, 10000, len(prices))
 
     # Create OHLC data
     df = pd.DataFrame({
         'timestamp': timestamps,
-        'open': prices * (1 + np.random.randn(len(prices)) * 0.002),
-        'high': prices * (1 + np.abs(np.random.randn(len(prices))) * 0.005),
-        'low': prices * (1 - np.abs(np.random.randn(len(prices))) * 0.005),
+        'open': prices * (1 + jitter[:, 0] * 0.002),
+        'high': prices * (1 + jitter[:, 1] * 0.005),
+        'low': prices * (1 - jitter[:, 2] * 0.005),
         'close': prices,
-        'volume': np.random.randint(1000, 10000, len(prices))
+        'volume': volume
     })
 
     return df
 
-def test_position_class():
-    """Test Position class methods"""
-    print("=" * 70)
-    print("Test 1: Position Class")
-    print("=" * 70)
-
-    # Create a LONG position
-    pos = Position(
+@pytest.fixture
+def long_position():
+    """LONG position @ $100 with SL $95 / TP $110"""
+    return Position(
         symbol='BTC/USDT',
         side='LONG',
         entry_time=datetime.now(),
@@ -77,269 +74,202 @@ def test_position_class():
         take_profit=110.0
     )
 
-    # Test P&L calculations
-    current_price = 105.0
-    pnl = pos.calculate_pnl(current_price)
-    pnl_pct = pos.calculate_pnl_pct(current_price)
 
-    print(f"  LONG Position @ $100, Current: $105")
-    print(f"  P&L: ${pnl:.2f} ({pnl_pct:+.2f}%)")
+def test_position_pnl(long_position):
+    """Test Position P&L calculations"""
+    pnl = long_position.calculate_pnl(105.0)
+    pnl_pct = long_position.calculate_pnl_pct(105.0)
 
-    assert pnl == 5.0, f"Expected P&L of 5.0, got {pnl}"
-    assert abs(pnl_pct - 5.0) < 0.01, f"Expected P&L% of 5.0, got {pnl_pct}"
+    np.testing.assert_allclose([pnl, pnl_pct], [5.0, 5.0], rtol=1e-6)
 
-    # Test stop loss check
-    assert not pos.check_stop_loss(96.0), "Should not hit stop loss at $96"
-    assert pos.check_stop_loss(94.0), "Should hit stop loss at $94"
 
-    # Test take profit check
-    assert not pos.check_take_profit(109.0), "Should not hit take profit at $109"
-    assert pos.check_take_profit(111.0), "Should hit take profit at $111"
+@pytest.mark.parametrize('price,stop_hit,target_hit', [
+    (94.0, True, False),
+    (96.0, False, False),
+    (109.0, False, False),
+    (111.0, False, True),
+])
+def test_position_exit_checks(long_position, price, stop_hit, target_hit):
+    """Test Position stop loss and take profit checks"""
+    assert long_position.check_stop_loss(price) == stop_hit
+    assert long_position.check_take_profit(price) == target_hit
 
-    print("  ✅ All position calculations correct")
-    return True
 
-def test_backtester_initialization():
-    """Test Backtester initialization"""
-    print("\n" + "=" * 70)
-    print("Test 2: Backtester Initialization")
-    print("=" * 70)
+def test_backtester_structure():
+    """Test Backtester exposes the simulation entry points"""
+    # The agent needs an exchange connection, so only check the class itself
+    for method in ('run', 'run_arrays', 'reset'):
+        assert callable(getattr(Backtester, method, None)), f"Missing Backtester.{method}"
 
-    # Note: We can't actually initialize the agent without exchange connection
-    # So we'll just test the conceptual structure
 
-    print("  Backtester class structure:")
-    print("    ✅ Position management")
-    print("    ✅ Trade execution with slippage and fees")
-    print("    ✅ Performance tracking")
-    print("    ✅ Metrics calculation")
+@pytest.mark.parametrize('trend', ['up', 'down', 'sideways'])
+def test_synthetic_data_structure(trend):
+    """Test synthetic data has the columns the backtester needs"""
+    data = create_synthetic_data(days=10, starting_price=100, trend=trend)
 
-    return True
+    assert list(data.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+    assert len(data) == 10 * 24
+    assert (data['high'] >= data['close']).all()
+    assert (data['low'] <= data['close']).all()
 
-def test_synthetic_backtest_simple():
-    """Test backtest with simple synthetic data"""
-    print("\n" + "=" * 70)
-    print("Test 3: Simple Backtest (Mock)")
-    print("=" * 70)
 
-    # Create synthetic uptrend data
-    data = create_synthetic_data(days=10, starting_price=100, trend='up')
+class _MeanReversionStub:
+    """
+    Offline stand-in for the trading agent
 
-    print(f"  Created {len(data)} candles of synthetic data")
-    print(f"  Period: {data['timestamp'].iloc[0]} to {data['timestamp'].iloc[-1]}")
-    print(f"  Price range: ${data['close'].min():.2f} - ${data['close'].max():.2f}")
+    Goes LONG when the last close is above the window mean and SHORT
+    otherwise, with a 1% stop and a 2% target, so every candle gets a
+    deterministic signal.
+    """
 
-    # Since we can't run the actual agent without exchange connection,
-    # we'll validate the data structure
-    required_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-    for col in required_columns:
-        assert col in data.columns, f"Missing column: {col}"
+    def comprehensive_analysis(self, symbol, window):
+        close = window['close'].iloc[-1]
+        side = 'LONG' if close > window['close'].mean() else 'SHORT'
+        sign = 1 if side == 'LONG' else -1
+        return {'recommendation': {
+            'action': side,
+            'confidence': 60,
+            'entry_price': close,
+            'stop_loss': close * (1 - sign * 0.01),
+            'take_profit': close * (1 + sign * 0.02),
+        }}
+
+
+def test_backtest_regression():
+    """Pin the trade loop's results on a fixed series (values from the original per-candle loop)"""
+    data = create_synthetic_data(days=30, starting_price=100, trend='sideways')
+    backtester = Backtester(_MeanReversionStub())
+
+    result = backtester.run(data)
+    assert (result.total_trades, result.winning_trades) == (199, 78)
+    np.testing.assert_allclose(result.final_capital, 9493.153515607855, rtol=1e-9)
+    assert len(result.equity_curve) == len(data)
+
+    # The array entry point and a reused backtester must reproduce the run
+    arrays = {col: data[col].to_numpy() for col in ('open', 'high', 'low', 'close', 'volume')}
+    again = backtester.run_arrays(data['timestamp'].to_numpy(), arrays)
+    assert again.total_trades == result.total_trades
+    np.testing.assert_allclose(again.final_capital, result.final_capital, rtol=1e-12)
+
+
+def test_sweep_matches_direct_runs(monkeypatch, tmp_path):
+    """Test the memmapped window sweep against backtesting each window directly"""
+    import tempfile
+    from run_backtest import StrategyValidator
+
+    data = create_synthetic_data(days=30, starting_price=100, trend='sideways')
+    windows = [('2024-01-01', '2024-01-16'), ('2024-01-10', '2024-01-31')]
+
+    validator = StrategyValidator()
+    monkeypatch.setattr(validator, '_load_data', lambda *args, **kwargs: data)
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+
+    swept = validator.sweep(windows, n_jobs=2, agent=_MeanReversionStub())
+
+    assert [window for window, _ in swept] == windows
+    backtester = Backtester(_MeanReversionStub(), initial_capital=validator.config.backtest.initial_capital,
+                            trading_fee=validator.config.backtest.trading_fee,
+                            slippage=validator.config.backtest.slippage)
+    for (start, end), result in swept:
+        in_window = (data['timestamp'] >= start) & (data['timestamp'] < end)
+        expected = backtester.run(data[in_window].reset_index(drop=True))
+        assert result.total_trades == expected.total_trades > 0
+        np.testing.assert_allclose(result.final_capital, expected.final_capital, rtol=1e-12)
+
+    # The sweep's memmap file is removed once the workers are done
+    assert not any(tmp_path.iterdir())
+
+
+def test_load_data_refreshes_stale_parquet(monkeypatch, tmp_path):
+    """Test that a Parquet cache older than its CSV is ignored and rewritten"""
+    import os
+    from run_backtest import StrategyValidator
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'data').mkdir()
+    csv_path = tmp_path / 'data' / 'BTC_USDT_1h_2024-01-01.csv'
+    parquet_path = csv_path.with_suffix('.parquet')
+
+    fresh = create_synthetic_data(days=2, trend='up')
+    create_synthetic_data(days=2, trend='down').to_parquet(parquet_path, index=False)
+    fresh.to_csv(csv_path, index=False)
+    # The CSV was refreshed after the Parquet copy was written
+    os.utime(parquet_path, (1_000_000, 1_000_000))
+
+    df = StrategyValidator()._load_data(
+        'BTC/USDT', '1h', start_date='2024-01-01', end_date=None, use_synthetic=False, synthetic_days=2
+    )
 
-    print("  ✅ Data structure valid for backtesting")
+    np.testing.assert_allclose(df['close'].to_numpy(), fresh['close'].to_numpy())
+    assert parquet_path.stat().st_mtime >= csv_path.stat().st_mtime
+    np.testing.assert_allclose(pd.read_parquet(parquet_path)['close'].to_numpy(), fresh['close'].to_numpy())
 
-    return True
 
 def test_metrics_calculation():
     """Test performance metrics calculation"""
-    print("\n" + "=" * 70)
-    print("Test 4: Performance Metrics Calculation")
-    print("=" * 70)
-
-    # Create sample trades
+    # (start, end, side, entry, exit, pnl after fees, pnl %, exit reason, hours)
+    rows = [
+        (datetime(2024, 1, 1, 10), datetime(2024, 1, 1, 14), 'LONG', 100.0, 105.0, 4.9, 5.0, 'TAKE_PROFIT', 4.0),
+        (datetime(2024, 1, 2, 10), datetime(2024, 1, 2, 12), 'LONG', 105.0, 103.0, -2.1, -1.9, 'STOP_LOSS', 2.0),
+        (datetime(2024, 1, 3, 10), datetime(2024, 1, 3, 16), 'SHORT', 103.0, 100.0, 2.9, 2.9, 'TAKE_PROFIT', 6.0),
+    ]
     trades = [
         Trade(
-            entry_time=datetime(2024, 1, 1, 10, 0),
-            exit_time=datetime(2024, 1, 1, 14, 0),
-            symbol='BTC/USDT',
-            side='LONG',
-            entry_price=100.0,
-            exit_price=105.0,
-            position_size=1.0,
-            pnl=4.9,  # After fees
-            pnl_pct=5.0,
-            exit_reason='TAKE_PROFIT',
-            holding_period_hours=4.0
-        ),
-        Trade(
-            entry_time=datetime(2024, 1, 2, 10, 0),
-            exit_time=datetime(2024, 1, 2, 12, 0),
-            symbol='BTC/USDT',
-            side='LONG',
-            entry_price=105.0,
-            exit_price=103.0,
-            position_size=1.0,
-            pnl=-2.1,  # After fees
-            pnl_pct=-1.9,
-            exit_reason='STOP_LOSS',
-            holding_period_hours=2.0
-        ),
-        Trade(
-            entry_time=datetime(2024, 1, 3, 10, 0),
-            exit_time=datetime(2024, 1, 3, 16, 0),
-            symbol='BTC/USDT',
-            side='SHORT',
-            entry_price=103.0,
-            exit_price=100.0,
-            position_size=1.0,
-            pnl=2.9,  # After fees
-            pnl_pct=2.9,
-            exit_reason='TAKE_PROFIT',
-            holding_period_hours=6.0
-        ),
+            entry_time=entry_time, exit_time=exit_time, symbol='BTC/USDT', side=side,
+            entry_price=entry_price, exit_price=exit_price, position_size=1.0,
+            pnl=pnl, pnl_pct=pnl_pct, exit_reason=reason, holding_period_hours=hours
+        )
+        for entry_time, exit_time, side, entry_price, exit_price, pnl, pnl_pct, reason, hours in rows
     ]
 
-    # Calculate metrics manually
-    winning_trades = [t for t in trades if t.pnl > 0]
-    losing_trades = [t for t in trades if t.pnl <= 0]
-
-    win_rate = (len(winning_trades) / len(trades)) * 100
-    total_pnl = sum(t.pnl for t in trades)
-
-    gross_profit = sum(t.pnl for t in winning_trades)
-    gross_loss = abs(sum(t.pnl for t in losing_trades))
-    profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0
-
-    print(f"  Total Trades: {len(trades)}")
-    print(f"  Winning: {len(winning_trades)}, Losing: {len(losing_trades)}")
-    print(f"  Win Rate: {win_rate:.1f}%")
-    print(f"  Total P&L: ${total_pnl:+.2f}")
-    print(f"  Profit Factor: {profit_factor:.2f}")
-
-    assert len(trades) == 3, "Should have 3 trades"
-    assert len(winning_trades) == 2, "Should have 2 winning trades"
-    assert len(losing_trades) == 1, "Should have 1 losing trade"
-    assert abs(win_rate - 66.67) < 0.1, f"Win rate should be ~66.67%, got {win_rate:.2f}%"
-    assert profit_factor > 1.0, "Profit factor should be > 1.0 (profitable)"
+    pnls = np.array([t.pnl for t in trades])
+    wins = pnls > 0
 
-    print("  ✅ All metrics calculated correctly")
+    win_rate = wins.mean() * 100
+    gross_profit = pnls[wins].sum()
+    gross_loss = -pnls[~wins].sum()
+    profit_factor = gross_profit / gross_loss
 
-    return True
-
-def test_risk_management():
-    """Test position sizing and risk management"""
-    print("\n" + "=" * 70)
-    print("Test 5: Risk Management")
-    print("=" * 70)
-
-    # Test 2% risk rule
-    capital = 10000
-    risk_per_trade = 0.02  # 2%
-    max_risk = capital * risk_per_trade
-
-    entry_price = 100.0
-    stop_loss = 95.0
-    risk_per_unit = entry_price - stop_loss
-
-    position_size = max_risk / risk_per_unit
-
-    print(f"  Capital: ${capital:,.2f}")
-    print(f"  Max Risk: ${max_risk:,.2f} (2%)")
-    print(f"  Entry: ${entry_price:.2f}, Stop: ${stop_loss:.2f}")
-    print(f"  Risk per unit: ${risk_per_unit:.2f}")
-    print(f"  Position size: {position_size:.2f} units")
-    print(f"  Position value: ${position_size * entry_price:,.2f}")
+    assert (wins.sum(), (~wins).sum()) == (2, 1)
+    np.testing.assert_allclose(
+        [win_rate, pnls.sum(), profit_factor],
+        [200 / 3, 5.7, 7.8 / 2.1],
+        rtol=1e-6
+    )
 
-    # Verify risk is exactly 2%
-    actual_risk = position_size * risk_per_unit
-    risk_pct = (actual_risk / capital) * 100
 
-    assert abs(risk_pct - 2.0) < 0.01, f"Risk should be 2%, got {risk_pct:.2f}%"
+@pytest.mark.parametrize('capital,entry_price,stop_loss', [
+    (10000, 100.0, 95.0),
+    (10000, 100.0, 99.0),
+    (50000, 40000.0, 38000.0),
+])
+def test_risk_management(capital, entry_price, stop_loss):
+    """Test 2% risk rule position sizing"""
+    risk_per_trade = 0.02
+    position_size = capital * risk_per_trade / (entry_price - stop_loss)
 
-    print(f"  Actual risk if stopped out: ${actual_risk:.2f} ({risk_pct:.2f}%)")
-    print("  ✅ Risk management calculations correct")
+    # Being stopped out loses exactly 2% of capital
+    actual_risk = position_size * (entry_price - stop_loss)
+    np.testing.assert_allclose(actual_risk / capital * 100, 2.0, rtol=1e-6)
 
-    return True
 
 def test_slippage_and_fees():
     """Test slippage and fee calculations"""
-    print("\n" + "=" * 70)
-    print("Test 6: Slippage and Fees")
-    print("=" * 70)
-
     entry_price = 100.0
     slippage = 0.0005  # 0.05%
     trading_fee = 0.001  # 0.1%
-
-    # Buy with slippage (pay more)
-    buy_price = entry_price * (1 + slippage)
-
-    # Sell with slippage (receive less)
-    sell_price = entry_price * (1 - slippage)
-
-    # Calculate fees on a $10,000 position
     position_value = 10000
-    entry_fees = position_value * trading_fee
-    exit_fees = position_value * trading_fee
-    total_fees = entry_fees + exit_fees
 
-    # Total cost of slippage
-    slippage_cost = (buy_price - entry_price) + (entry_price - sell_price)
-    slippage_cost_dollars = slippage_cost * (position_value / entry_price)
+    buy_price = entry_price * (1 + slippage)  # Pay more
+    sell_price = entry_price * (1 - slippage)  # Receive less
+    total_fees = 2 * position_value * trading_fee  # Entry + exit
 
-    print(f"  Entry price: ${entry_price:.2f}")
-    print(f"  Buy with slippage: ${buy_price:.2f} (+{slippage*100:.2f}%)")
-    print(f"  Sell with slippage: ${sell_price:.2f} (-{slippage*100:.2f}%)")
-    print(f"\n  Position value: ${position_value:,.2f}")
-    print(f"  Entry fees: ${entry_fees:.2f}")
-    print(f"  Exit fees: ${exit_fees:.2f}")
-    print(f"  Total fees: ${total_fees:.2f}")
-    print(f"  Slippage cost: ${slippage_cost_dollars:.2f}")
-    print(f"  Total friction: ${total_fees + slippage_cost_dollars:.2f}")
-
-    assert abs(buy_price - 100.05) < 0.01, "Buy price with slippage incorrect"
-    assert abs(sell_price - 99.95) < 0.01, "Sell price with slippage incorrect"
-    assert abs(total_fees - 20.0) < 0.01, "Total fees incorrect"
-
-    print("  ✅ Slippage and fee calculations correct")
+    np.testing.assert_allclose(
+        [buy_price, sell_price, total_fees],
+        [100.05, 99.95, 20.0],
+        rtol=1e-6
+    )
 
-    return True
 
 if __name__ == '__main__':
-    print("\n" + "=" * 70)
-    print("BACKTESTING FRAMEWORK TEST SUITE")
-    print("=" * 70)
-    print()
-
-    results = []
-
-    try:
-        results.append(("Position class", test_position_class()))
-        results.append(("Backtester initialization", test_backtester_initialization()))
-        results.append(("Synthetic backtest data", test_synthetic_backtest_simple()))
-        results.append(("Metrics calculation", test_metrics_calculation()))
-        results.append(("Risk management", test_risk_management()))
-        results.append(("Slippage and fees", test_slippage_and_fees()))
-    except Exception as e:
-        print(f"\n❌ CRITICAL ERROR: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
-
-    print("\n" + "=" * 70)
-    print("SUMMARY")
-    print("=" * 70)
-
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
-
-    for name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
-        print(f"{status}: {name}")
-
-    print(f"\nTotal: {passed}/{total} tests passed")
-
-    if passed == total:
-        print("\n🎉 ALL TESTS PASSED!")
-        print("\nBacktesting framework is ready:")
-        print("  ✅ Position management (open/close with SL/TP)")
-        print("  ✅ Realistic execution (slippage + fees)")
-        print("  ✅ Risk management (2% rule, position sizing)")
-        print("  ✅ Performance metrics (Sharpe, drawdown, win rate)")
-        print("  ✅ Trade logging and equity tracking")
-        print("\nFramework created: cryptocurrency-trader-skill/scripts/backtester.py (675 lines)")
-        print("\nNote: Full integration test with trading agent requires")
-        print("      exchange connection. Framework is structurally complete.")
-        sys.exit(0)
-    else:
-        print("\n⚠️  Some tests failed")
-        sys.exit(1)
+    sys.exit(pytest.main([__file__, '-q']))
@@ -7,6 +7,7 @@ Validates that the strategy validation framework works correctly.
 
 import unittest
 import sys
+from functools import lru_cache
 from pathlib import Path
 import pandas as pd
 import numpy as np
@@ -18,12 +19,24 @@ from run_backtest import StrategyValidator
 from fetch_historical_data import create_synthetic_data
 
 
+@lru_cache(maxsize=8)
+def _cached_validate(symbol: str = 'BTC/USDT', timeframe: str = '1h', synthetic_days: int = 30):
+    """Run (once per argument tuple) a synthetic-data validation shared by the tests below"""
+    return StrategyValidator().validate_strategy(
+        symbol=symbol,
+        timeframe=timeframe,
+        use_synthetic=True,
+        synthetic_days=synthetic_days
+    )
+
+
 class TestBacktestValidation(unittest.TestCase):
     """Test suite for backtest validation system"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.validator = StrategyValidator()
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures (no test mutates the validator, so build it once)"""
+        cls.validator = StrategyValidator()
 
     def test_validator_initialization(self):
         """Test that validator initializes correctly"""
@@ -33,12 +46,7 @@ class TestBacktestValidation(unittest.TestCase):
 
     def test_single_validation_synthetic(self):
         """Test single validation with synthetic data"""
-        result = self.validator.validate_strategy(
-            symbol='BTC/USDT',
-            timeframe='1h',
-            use_synthetic=True,
-            synthetic_days=30  # Short test
-        )
+        result = _cached_validate('BTC/USDT', '1h', 30)  # Short test
 
         # Check that we got results
         self.assertIsNotNone(result)
@@ -58,10 +66,7 @@ class TestBacktestValidation(unittest.TestCase):
 
     def test_assessment_criteria(self):
         """Test that assessment criteria are evaluated correctly"""
-        result = self.validator.validate_strategy(
-            use_synthetic=True,
-            synthetic_days=30
-        )
+        result = _cached_validate('BTC/USDT', '1h', 30)
 
         assessment = result['assessment']
 
@@ -116,11 +121,7 @@ class TestBacktestValidation(unittest.TestCase):
 
     def test_recommendation_logic(self):
         """Test that recommendation logic is sound"""
-        # Create a validator
-        result = self.validator.validate_strategy(
-            use_synthetic=True,
-            synthetic_days=30
-        )
+        result = _cached_validate('BTC/USDT', '1h', 30)
 
         assessment = result['assessment']
         recommendation = assessment['recommendation']
@@ -141,10 +142,7 @@ class TestBacktestValidation(unittest.TestCase):
 
     def test_data_period_tracking(self):
         """Test that data period is tracked correctly"""
-        result = self.validator.validate_strategy(
-            use_synthetic=True,
-            synthetic_days=30
-        )
+        result = _cached_validate('BTC/USDT', '1h', 30)
 
         # Check data period is tracked
         self.assertIn('data_period', result)
@@ -4,132 +4,113 @@ Simple unit tests for division by zero fixes
 Tests the calculation logic directly without requiring exchange connections
 """
 
+import os
+import sys
+from functools import partial
+
 import numpy as np
-import pandas as pd
+import pytest
 
-def test_rsi_with_zero_loss():
-    """Test RSI calculation with only gains (loss = 0)"""
-    print("Test 1: RSI with zero loss...")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cryptocurrency-trader-skill', 'scripts'))
 
-    # Create series with only upward movements
-    prices = pd.Series([100 + i * 0.5 for i in range(50)])
-    delta = prices.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+from indicator_kernels import rolling_rsi, rsi_np, rsi_wilder, stochastic_k, stochastic_np
 
-    # OLD CODE (would crash):
+def _random_walk(n, seed):
+    """Seeded random walk starting at 100 with mixed up/down movements"""
+    rng = np.random.default_rng(seed)
+    return np.r_[100.0, 100.0 + np.cumsum(rng.standard_normal(n - 1) * 2)]
+
+# (description, price series, lowest valid RSI, highest valid RSI)
+RSI_CASES = (
+    ("zero loss", lambda: 100 + np.arange(50) * 0.5, 95, 100),  # Only upward movements
+    ("mixed movements (sanity check)", lambda: _random_walk(50, seed=42), 0, 100),
+)
+
+@pytest.mark.parametrize('name,prices_fn,lo,hi', RSI_CASES, ids=[case[0] for case in RSI_CASES])
+def test_rsi(name, prices_fn, lo, hi):
+    """Test RSI calculation stays finite and in range, including with only gains (loss = 0)"""
+    print(f"Test 1: RSI with {name}...")
+    prices = prices_fn()
+
+    # OLD CODE (would crash with no losses):
     # rs = gain / loss  # Division by zero!
 
-    # NEW CODE (with fix):
-    rs = gain / loss.replace(0, 1e-10)
-    rsi = 100 - (100 / (1 + rs))
+    # NEW CODE (with fix): the kernel floors the average loss at 1e-10
+    rsi = rolling_rsi(prices, 14)
+
+    final_rsi = rsi[-1]
+    assert np.isfinite(final_rsi) and lo <= final_rsi <= hi, f"RSI = {final_rsi} (should be {lo}-{hi})"
 
-    # Verify RSI is valid
-    final_rsi = rsi.iloc[-1]
-    if np.isnan(final_rsi) or np.isinf(final_rsi):
-        print(f"  ❌ FAIL: RSI is {final_rsi}")
-        return False
+    # The loop kernel and the vectorized version must agree
+    assert np.allclose(rsi, rsi_np(prices, 14), equal_nan=True), "rolling_rsi and rsi_np disagree"
 
-    print(f"  ✅ PASS: RSI = {final_rsi:.2f} (should be near 100)")
-    return True
+    # Wilder smoothing must take the same guard
+    final_wilder = rsi_wilder(prices, 14)[-1]
+    assert np.isfinite(final_wilder) and lo <= final_wilder <= hi, \
+        f"Wilder RSI = {final_wilder} (should be {lo}-{hi})"
+
+    print(f"  ✅ PASS: RSI = {final_rsi:.2f}, Wilder RSI = {final_wilder:.2f} (valid range)")
 
 def test_stochastic_flat_market():
     """Test Stochastic with flat market (high == low)"""
     print("Test 2: Stochastic with flat market...")
 
     # Create flat price data
-    df = pd.DataFrame({
-        'close': [100.0] * 50,
-        'high': [100.0] * 50,
-        'low': [100.0] * 50
-    })
-
-    low_14 = df['low'].rolling(14).min()
-    high_14 = df['high'].rolling(14).max()
+    flat = np.full(50, 100.0)
 
     # OLD CODE (would crash):
     # stoch_k = 100 * ((df['close'] - low_14) / (high_14 - low_14))  # Division by zero!
 
-    # NEW CODE (with fix):
-    range_14 = (high_14 - low_14).replace(0, 1e-10)
-    stoch_k = 100 * ((df['close'] - low_14) / range_14)
+    # NEW CODE (with fix): the kernel floors the high-low range at 1e-10
+    stoch_k = stochastic_k(flat, flat, flat, 14)
 
     # Verify Stochastic is valid
-    final_stoch = stoch_k.iloc[-1]
-    if np.isnan(final_stoch) or np.isinf(final_stoch):
-        print(f"  ❌ FAIL: Stochastic is {final_stoch}")
-        return False
+    final_stoch = stoch_k[-1]
+    assert np.isfinite(final_stoch), f"Stochastic is {final_stoch}"
+
+    assert np.allclose(stoch_k, stochastic_np(flat, flat, flat, 14), equal_nan=True), \
+        "stochastic_k and stochastic_np disagree"
 
     print(f"  ✅ PASS: Stochastic = {final_stoch:.2f}")
-    return True
 
 def test_price_comparison_zero():
     """Test pattern recognition price comparisons with zero check"""
     print("Test 3: Price comparisons with zero protection...")
 
     # Simulate price comparison scenarios
-    test_cases = [
+    test_cases = np.array([
         (100.0, 101.0, True, "normal prices (1% difference)"),
         (0.001, 0.00101, True, "very small prices (1% difference)"),
         (0.0, 100.0, False, "zero price (should skip)"),  # This should be skipped
-    ]
-
-    all_passed = True
-    for peak1_price, peak2_price, should_process, desc in test_cases:
-        # OLD CODE (would crash on zero):
-        # if abs(peak1_price - peak2_price) / peak1_price < 0.02:
-
-        # NEW CODE (with protection):
-        try:
-            if peak1_price > 0 and abs(peak1_price - peak2_price) / peak1_price < 0.02:
-                result = "processed"
-            else:
-                result = "skipped"
-
-            expected = "processed" if should_process else "skipped"
-            if result == expected:
-                print(f"  ✅ {desc}: {result} (correct)")
-            else:
-                print(f"  ❌ {desc}: {result}, expected {expected}")
-                all_passed = False
-        except ZeroDivisionError:
-            print(f"  ❌ {desc}: ZeroDivisionError occurred!")
-            all_passed = False
-
-    return all_passed
-
-def test_rsi_with_mixed_movements():
-    """Test RSI with normal mixed up/down movements"""
-    print("Test 4: RSI with mixed movements (sanity check)...")
-
-    # Create realistic random walk
-    np.random.seed(42)
-    prices = [100]
-    for i in range(49):
-        change = np.random.randn() * 2
-        prices.append(prices[-1] + change)
-
-    prices_series = pd.Series(prices)
-    delta = prices_series.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-
-    rs = gain / loss.replace(0, 1e-10)
-    rsi = 100 - (100 / (1 + rs))
-
-    final_rsi = rsi.iloc[-1]
-    if np.isnan(final_rsi) or np.isinf(final_rsi) or not (0 <= final_rsi <= 100):
-        print(f"  ❌ FAIL: RSI = {final_rsi} (should be 0-100)")
-        return False
-
-    print(f"  ✅ PASS: RSI = {final_rsi:.2f} (valid range)")
-    return True
+    ], dtype=[('peak1', 'f8'), ('peak2', 'f8'), ('should_process', '?'), ('desc', 'U40')])
+    peak1 = test_cases['peak1']
+    peak2 = test_cases['peak2']
+
+    # OLD CODE (would crash on zero):
+    # if abs(peak1_price - peak2_price) / peak1_price < 0.02:
+
+    # NEW CODE (with protection), over every case at once; division only
+    # happens where peak1 > 0, so a zero price is never divided by
+    valid = peak1 > 0
+    diff_pct = np.divide(np.abs(peak1 - peak2), peak1, out=np.full_like(peak1, np.inf), where=valid)
+    processed = valid & (diff_pct < 0.02)
+    correct = processed == test_cases['should_process']
+
+    for case, was_processed, ok in zip(test_cases, processed, correct):
+        result = "processed" if was_processed else "skipped"
+        if ok:
+            print(f"  ✅ {case['desc']}: {result} (correct)")
+        else:
+            expected = "processed" if case['should_process'] else "skipped"
+            print(f"  ❌ {case['desc']}: {result}, expected {expected}")
+
+    assert correct.all(), "Price comparisons mishandled: " + ", ".join(test_cases['desc'][~correct])
 
 def test_all_locations():
     """Test that all 8 fixed locations handle edge cases"""
-    print("Test 5: Verify all 8 locations are protected...")
+    print("Test 4: Verify all 8 locations are protected...")
 
-    locations = [
+    locations = (
         "trading_agent_enhanced.py:159 - RSI calculation",
         "trading_agent_enhanced.py:188 - Stochastic Oscillator",
         "advanced_validation.py:317 - RSI validation",
@@ -138,41 +119,45 @@ def test_all_locations():
         "pattern_recognition.py:214 - Head & shoulders comparison",
         "pattern_recognition.py:255 - Inverse H&S comparison",
         "pattern_recognition.py:535 - Price clustering comparison",
-    ]
+    )
 
     print(f"  ✅ All {len(locations)} locations protected:")
     for loc in locations:
         print(f"     • {loc}")
 
-    return True
-
 if __name__ == '__main__':
     print("=" * 70)
     print("DIVISION BY ZERO FIX - SIMPLE UNIT TESTS")
     print("=" * 70)
     print()
 
-    results = []
-
-    try:
-        results.append(test_rsi_with_zero_loss())
-        results.append(test_stochastic_flat_market())
-        results.append(test_price_comparison_zero())
-        results.append(test_rsi_with_mixed_movements())
-        results.append(test_all_locations())
-    except Exception as e:
-        print(f"\n❌ CRITICAL ERROR: {e}")
-        import traceback
-        traceback.print_exc()
-        import sys
-        sys.exit(1)
+    tests = (
+        *(partial(test_rsi, *case) for case in RSI_CASES),
+        test_stochastic_flat_market,
+        test_price_comparison_zero,
+        test_all_locations,
+    )
+    results = np.empty(len(tests), dtype=bool)
+
+    for i, test in enumerate(tests):
+        try:
+            test()
+            results[i] = True
+        except AssertionError as e:
+            print(f"  ❌ FAIL: {e}")
+            results[i] = False
+        except Exception as e:
+            print(f"\n❌ CRITICAL ERROR: {e}")
+            import traceback
+            traceback.print_exc()
+            sys.exit(1)
 
     print()
     print("=" * 70)
     print("SUMMARY")
     print("=" * 70)
 
-    passed = sum(results)
+    passed = int(results.sum())
     total = len(results)
 
     print(f"Passed: {passed}/{total}")
@@ -184,9 +169,7 @@ if __name__ == '__main__':
         print("  • Stochastic Oscillator protected (1 location)")
         print("  • Pattern recognition price comparisons protected (5 locations)")
         print("\nTotal: 8 locations fixed")
-        import sys
         sys.exit(0)
     else:
         print("\n⚠️  Some tests failed")
-        import sys
         sys.exit(1)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for the exchange data fetcher
+Tests chunked, paged OHLCV fetching and the merge of fetched chunks
+
+Run with pytest, or directly: python test_fetch_historical_data.py
+"""
+
+import asyncio
+import sys
+import numpy as np
+import pytest
+
+import ccxt.async_support as ccxt_async
+
+from fetch_historical_data import _fetch_chunks, _merge_candles
+
+
+def test_merge_candles_overlapping_chunks():
+    """Test that candles repeated by overlapping chunks are dropped and gaps counted"""
+    hour_ms = 3_600_000
+    # Two chunks overlapping on candles 4-6, then a two-candle gap before 10
+    ts = np.r_[np.arange(1, 7), np.arange(4, 9), 10] * hour_ms
+    arr = np.column_stack([ts, np.ones((len(ts), 5))]).astype(np.float64)
+
+    merged, num_gaps = _merge_candles(arr, hour_ms)
+
+    np.testing.assert_array_equal(merged[:, 0] / hour_ms, [1, 2, 3, 4, 5, 6, 7, 8, 10])
+    assert num_gaps == 1, f"Expected one gap, counted {num_gaps}"
+
+
+class _PageCappedExchange:
+    """Async exchange stub serving hourly candles 0..n-1, at most page_cap per request"""
+
+    page_cap = 300
+    num_candles = 2500
+    hour_ms = 3_600_000
+
+    def __init__(self, config):
+        self.last_response_headers = {}
+
+    async def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        first = -(-since // self.hour_ms)
+        last = min(first + min(limit, self.page_cap), self.num_candles)
+        return [[i * self.hour_ms, 1.0, 1.0, 1.0, 1.0, 1.0] for i in range(first, last)]
+
+    async def close(self):
+        pass
+
+
+def test_fetch_chunks_pages_below_limit(monkeypatch):
+    """Test that every chunk is filled when the exchange caps pages below limit"""
+    hour_ms = _PageCappedExchange.hour_ms
+    limit = 1000
+    chunk_starts = [i * limit * hour_ms for i in range(4)]  # One chunk past the data
+
+    # _fetch_chunks looks the exchange class up by name on ccxt.async_support
+    monkeypatch.setattr(ccxt_async, 'page_capped_stub', _PageCappedExchange, raising=False)
+    chunks = asyncio.run(_fetch_chunks(
+        'page_capped_stub', 'BTC/USDT', '1h', chunk_starts, limit * hour_ms, limit, concurrency=2
+    ))
+
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 500, 0]
+    timestamps = [candle[0] for chunk in chunks for candle in chunk]
+    assert timestamps == [i * hour_ms for i in range(_PageCappedExchange.num_candles)]
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__]))
@@ -14,6 +14,9 @@ sys.path.insert(0, str(Path(__file__).parent / 'cryptocurrency-trader-skill' / '
 
 from advanced_analytics import AdvancedAnalytics
 
+# monte_carlo_simulation keeps no state between calls, so one engine serves every test
+_ANALYTICS = AdvancedAnalytics()
+
 def test_gbm_unbiased():
     """
     Test that GBM produces unbiased results with zero drift
@@ -21,153 +24,161 @@ def test_gbm_unbiased():
     With zero mean returns, the expected price should equal current price
     (within statistical tolerance)
     """
-    print("=" * 70)
-    print("Testing GBM Systematic Bias Fix")
-    print("=" * 70)
-
-    analytics = AdvancedAnalytics()
-
     # Create synthetic returns with zero mean (no drift)
-    np.random.seed(42)  # Reproducible results
-    returns = pd.Series(np.random.normal(0, 0.02, 100))  # Mean=0, Std=2%
+    rng = np.random.default_rng(42)  # Reproducible results
+    returns = pd.Series(rng.normal(0, 0.02, 100))  # Mean=0, Std=2%
 
     current_price = 100.0
 
-    print(f"\nTest Parameters:")
-    print(f"  Current Price: ${current_price}")
-    print(f"  Returns Mean: {returns.mean():.6f} (should be ~0)")
-    print(f"  Returns Std: {returns.std():.4f}")
-    print(f"  Simulations: 10,000")
-    print(f"  Days Ahead: 5")
+    lines = [
+        "=" * 70,
+        "Testing GBM Systematic Bias Fix",
+        "=" * 70,
+        "\nTest Parameters:",
+        f"  Current Price: ${current_price}",
+        f"  Returns Mean: {returns.mean():.6f} (should be ~0)",
+        f"  Returns Std: {returns.std():.4f}",
+        "  Simulations: 10,000",
+        "  Days Ahead: 5",
+    ]
 
     # Run Monte Carlo simulation
-    result = analytics.monte_carlo_simulation(current_price, returns, days_ahead=5, num_simulations=10000)
+    result = _ANALYTICS.monte_carlo_simulation(current_price, returns, days_ahead=5, num_simulations=10000, rng=rng)
 
-    if 'error' in result:
-        print(f"\n❌ ERROR: {result['error']}")
-        return False
+    assert 'error' not in result, result.get('error')
 
     expected_price = result['expected_price']
     expected_return = result['expected_return_pct']
 
-    print(f"\nResults:")
-    print(f"  Expected Price: ${expected_price:.2f}")
-    print(f"  Expected Return: {expected_return:.2f}%")
-    print(f"  5th Percentile: ${result['price_5th_percentile']:.2f}")
-    print(f"  Median: ${result['price_median']:.2f}")
-    print(f"  95th Percentile: ${result['price_95th_percentile']:.2f}")
-
     # With zero drift, expected price should be very close to current price
     # Allow 2% tolerance due to sampling variance
     bias = abs(expected_price - current_price) / current_price
 
-    print(f"\nBias Analysis:")
-    print(f"  Absolute Bias: {bias*100:.2f}%")
-    print(f"  Tolerance: 2.0%")
+    lines += [
+        "\nResults:",
+        f"  Expected Price: ${expected_price:.2f}",
+        f"  Expected Return: {expected_return:.2f}%",
+        f"  5th Percentile: ${result['price_5th_percentile']:.2f}",
+        f"  Median: ${result['price_median']:.2f}",
+        f"  95th Percentile: ${result['price_95th_percentile']:.2f}",
+        "\nBias Analysis:",
+        f"  Absolute Bias: {bias*100:.2f}%",
+        "  Tolerance: 2.0%",
+    ]
 
-    if bias < 0.02:
-        print("\n✅ PASS: GBM appears unbiased (bias < 2%)")
-        print("   Itô's Lemma correction is working correctly!")
-        return True
-    else:
-        print("\n⚠️  WARNING: GBM shows bias > 2%")
-        print("   This might indicate the fix didn't work or sampling variance")
-        return False
+    print(*lines, sep='\n')
+    assert bias < 0.02, f"GBM shows bias {bias*100:.2f}% > 2%"
+    print(
+        "\n✅ PASS: GBM appears unbiased (bias < 2%)",
+        "   Itô's Lemma correction is working correctly!",
+        sep='\n',
+    )
 
 def test_gbm_positive_drift():
     """
     Test that GBM works correctly with positive drift
     """
-    print("\n" + "=" * 70)
-    print("Testing GBM with Positive Drift")
-    print("=" * 70)
-
-    analytics = AdvancedAnalytics()
-
     # Create returns with positive mean (upward drift)
-    np.random.seed(43)
-    returns = pd.Series(np.random.normal(0.01, 0.02, 100))  # Mean=1%, Std=2%
+    rng = np.random.default_rng(43)
+    returns = pd.Series(rng.normal(0.01, 0.02, 100))  # Mean=1%, Std=2%
 
     current_price = 100.0
 
-    print(f"\nTest Parameters:")
-    print(f"  Current Price: ${current_price}")
-    print(f"  Returns Mean: {returns.mean():.4f} (positive drift)")
-    print(f"  Returns Std: {returns.std():.4f}")
+    lines = [
+        "\n" + "=" * 70,
+        "Testing GBM with Positive Drift",
+        "=" * 70,
+        "\nTest Parameters:",
+        f"  Current Price: ${current_price}",
+        f"  Returns Mean: {returns.mean():.4f} (positive drift)",
+        f"  Returns Std: {returns.std():.4f}",
+    ]
+
+    result = _ANALYTICS.monte_carlo_simulation(current_price, returns, days_ahead=5, num_simulations=10000, rng=rng)
 
-    result = analytics.monte_carlo_simulation(current_price, returns, days_ahead=5, num_simulations=10000)
+    assert 'error' not in result, result.get('error')
 
-    if 'error' in result:
-        print(f"\n❌ ERROR: {result['error']}")
-        return False
+    lines += [
+        "\nResults:",
+        f"  Expected Price: ${result['expected_price']:.2f}",
+        f"  Expected Return: {result['expected_return_pct']:.2f}%",
+    ]
 
-    print(f"\nResults:")
-    print(f"  Expected Price: ${result['expected_price']:.2f}")
-    print(f"  Expected Return: {result['expected_return_pct']:.2f}%")
+    print(*lines, sep='\n')
 
     # With positive drift, expected price should be higher than current
-    if result['expected_price'] > current_price:
-        print("\n✅ PASS: Positive drift produces higher expected price")
-        return True
-    else:
-        print("\n❌ FAIL: Positive drift should produce higher expected price")
-        return False
+    assert result['expected_price'] > current_price, "Positive drift should produce higher expected price"
+    print("\n✅ PASS: Positive drift produces higher expected price")
 
 def test_gbm_no_crash():
     """
     Test that GBM doesn't crash with various inputs
     """
-    print("\n" + "=" * 70)
-    print("Testing GBM Robustness (No Crashes)")
-    print("=" * 70)
-
-    analytics = AdvancedAnalytics()
-
+    rng = np.random.default_rng(44)
     test_cases = [
-        ("Low volatility", np.random.normal(0, 0.001, 100)),
-        ("High volatility", np.random.normal(0, 0.05, 100)),
-        ("Negative drift", np.random.normal(-0.01, 0.02, 100)),
+        ("Low volatility", rng.normal(0, 0.001, 100)),
+        ("High volatility", rng.normal(0, 0.05, 100)),
+        ("Negative drift", rng.normal(-0.01, 0.02, 100)),
     ]
 
-    all_passed = True
+    lines = [
+        "\n" + "=" * 70,
+        "Testing GBM Robustness (No Crashes)",
+        "=" * 70,
+    ]
+
+    errors = []
     for name, returns_data in test_cases:
         returns = pd.Series(returns_data)
-        np.random.seed(44)
-        result = analytics.monte_carlo_simulation(100.0, returns, days_ahead=5, num_simulations=1000)
+        result = _ANALYTICS.monte_carlo_simulation(
+            100.0, returns, days_ahead=5, num_simulations=1000, rng=np.random.default_rng(44)
+        )
 
         if 'error' in result:
-            print(f"  ❌ {name}: {result['error']}")
-            all_passed = False
+            lines.append(f"  ❌ {name}: {result['error']}")
+            errors.append(name)
         else:
-            print(f"  ✅ {name}: Expected ${result['expected_price']:.2f}")
+            lines.append(f"  ✅ {name}: Expected ${result['expected_price']:.2f}")
 
-    return all_passed
+    print(*lines, sep='\n')
+    assert not errors, f"Simulation failed for: {', '.join(errors)}"
 
 if __name__ == '__main__':
-    print("\n" + "=" * 70)
-    print("GBM FIX VERIFICATION TEST SUITE")
-    print("=" * 70)
-
-    results = []
+    print(
+        "\n" + "=" * 70,
+        "GBM FIX VERIFICATION TEST SUITE",
+        "=" * 70,
+        sep='\n',
+    )
+
+    tests = (
+        ("Zero drift (unbiased test)", test_gbm_unbiased),
+        ("Positive drift", test_gbm_positive_drift),
+        ("Robustness", test_gbm_no_crash),
+    )
+    results = np.empty(len(tests), dtype=bool)
 
     # Run all tests
-    results.append(("Zero drift (unbiased test)", test_gbm_unbiased()))
-    results.append(("Positive drift", test_gbm_positive_drift()))
-    results.append(("Robustness", test_gbm_no_crash()))
-
-    # Summary
-    print("\n" + "=" * 70)
-    print("TEST SUMMARY")
-    print("=" * 70)
-
-    passed = sum(1 for _, result in results if result)
+    for i, (_, test) in enumerate(tests):
+        try:
+            test()
+            results[i] = True
+        except AssertionError as e:
+            print(f"\n❌ FAIL: {e}")
+            results[i] = False
+
+    passed = int(results.sum())
     total = len(results)
 
-    for name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
-        print(f"{status}: {name}")
-
-    print(f"\nTotal: {passed}/{total} tests passed")
+    # Summary
+    print(
+        "\n" + "=" * 70,
+        "TEST SUMMARY",
+        "=" * 70,
+        *(f"{'✅ PASS' if result else '❌ FAIL'}: {name}" for (name, _), result in zip(tests, results)),
+        f"\nTotal: {passed}/{total} tests passed",
+        sep='\n',
+    )
 
     if passed == total:
         print("\n🎉 ALL TESTS PASSED! GBM fix is working correctly.")
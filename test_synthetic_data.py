@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Verification test for the vectorized synthetic price walk
+Tests that the floored walk matches the original step-by-step loop
+"""
+
+import sys
+import numpy as np
+
+from fetch_historical_data import _floored_walk
+
+
+def _reference_walk(changes, starting_price, floor_ratio=0.5):
+    """Original loop implementation of the floored price walk"""
+    prices = [starting_price]
+    for change in changes:
+        new_price = prices[-1] * (1 + change)
+        prices.append(max(new_price, starting_price * floor_ratio))
+    return np.array(prices)
+
+
+def test_floored_walk_matches_loop():
+    """Test vectorized walk against the loop for all synthetic trends"""
+    print("=" * 70)
+    print("Testing Floored Price Walk")
+    print("=" * 70)
+
+    rng = np.random.default_rng(42)
+    periods = 5000
+    drifts = {
+        'up': 0.0002,
+        'down': -0.0002,
+        'sideways': 0.0,
+        'mixed': 0.0003 * np.sin(np.arange(1, periods) / 100 * 2 * np.pi),
+        'crash': -0.002,  # Hits the floor repeatedly
+    }
+
+    failed = []
+    for trend, drift in drifts.items():
+        changes = drift + rng.standard_normal(periods - 1) * 0.015
+        expected = _reference_walk(changes, 40000.0)
+        actual = _floored_walk(changes, 40000.0)
+
+        passed = (
+            len(actual) == periods
+            and actual.min() >= 40000.0 * 0.5 * (1 - 1e-12)
+            and np.allclose(actual, expected, rtol=1e-9)
+        )
+        status = "✅" if passed else "❌"
+        print(f"  {status} {trend}: max rel diff {np.max(np.abs(actual / expected - 1)):.2e}, "
+              f"min price ${actual.min():,.2f}")
+        if not passed:
+            failed.append(trend)
+
+    assert not failed, f"Floored walk diverges from the loop for: {', '.join(failed)}"
+
+
+if __name__ == '__main__':
+    try:
+        test_floored_walk_matches_loop()
+    except AssertionError as e:
+        print(f"\n❌ Tests failed: {e}")
+        sys.exit(1)
+    print("\n✅ All tests passed")
+    sys.exit(0)